@@ -3,47 +3,224 @@ BeerAdvocate Top Rated Beers Scraper
 A modular scraper to extract beer data from BeerAdvocate's top-rated page.
 """
 
+import asyncio
+import csv
+import functools
 import requests
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
-import pandas as pd
-import time
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
 import re
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple, Union
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, Iterator, List, Tuple
+from urllib.parse import urljoin, urlsplit
 from loguru import logger
 
+from src.util.async_http import RequestPacer, read_with_retry
+
+# aiohttp and pandas are imported where used, so a plain scrape loads neither
+if TYPE_CHECKING:
+    import aiohttp
+    import pandas as pd
+
+# Patterns used on every table row, compiled once at import.
+# PIPE_ABV_RE finds the first " | " separator and the first ABV percentage after it.
+PIPE_ABV_RE = re.compile(r' \| (?:.*?(\d+(?:\.\d+)?%))?', re.DOTALL)
+WS_RE = re.compile(r'\s+')
+
+# Keyword scans run as one case-insensitive pass, without lowercasing the text first
+CONTAINER_KEYWORDS_RE = re.compile(r'beer|brewery|rating|stout|ipa', re.IGNORECASE)
+CLASS_KEYWORDS_RE = re.compile(r'list|beer', re.IGNORECASE)
+TABLE_KEYWORDS = r'rating|beer|brewery|avg'
+
+# One lxml parser for every page; comments are dropped at parse time so
+# text walks never have to skip them
+HTML_PARSER = lxml_html.HTMLParser(remove_comments=True)
+
+# Endpoint pages downloaded at once by MultiEndpointScraper
+MAX_ENDPOINT_WORKERS = 4
+
+# Retry policy for transient failures, shared by the requests and aiohttp paths
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Rows and cells are read with XPath so the tree walk stays in C
+ROWS_XPATH = etree.XPath(".//tr")
+CELLS_XPATH = etree.XPath(".//td | .//th")
+MAIN_TABLE_XPATH = etree.XPath(
+    "(//table[count(.//tr) > 10]"
+    "[.//th[re:test(., $keywords, 'i')] or re:test((.//tr)[1], $keywords, 'i')])[1]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+# Common patterns for brewery names, in priority order for the text fallback parser
+BREWERY_NAME_PATTERNS = [
+    r'Toppling Goliath Brewing Company',
+    r'3 Floyds Brewing Co\.',
+    r'Perennial Artisan Ales',
+    r'Cigar City Brewing',
+    r'The Alchemist',
+    r'Tree House Brewing Company',
+    r'\w+\s+Brewing\s+(?:Company|Co\.?)',
+    r'\w+\s+Brewery',
+    r'Brasserie\s+\w+',
+    r'Brouwerij\s+\w+',
+]
+
+# All brewery patterns in one regex. Each branch is a lookahead anchored at the
+# start, so the first pattern found anywhere in the text wins, as when trying
+# them one by one; a plain alternation would prefer the leftmost match instead.
+BREWERY_RE = re.compile(
+    "|".join(
+        rf"^(?=.*?(?P<brewery{i}>{pattern}))"
+        for i, pattern in enumerate(BREWERY_NAME_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
+
+def _to_int(text: str) -> Optional[int]:
+    """
+    Parse an integer that may contain thousands separators.
+
+    Args:
+        text: Text such as "1,234"
+
+    Returns:
+        The integer, or None if the text is not a number
+    """
+    try:
+        return int(text.replace(',', ''))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _split_beer_info(clean_info: str) -> Tuple[str, str, str]:
+    """
+    Split whitespace-normalized beer text into name, brewery and style.
+
+    Args:
+        clean_info: Beer information with whitespace collapsed
+
+    Returns:
+        Tuple of (beer_name, brewery, style)
+    """
+    # Try to match brewery patterns; lastgroup names the one that matched
+    match = BREWERY_RE.match(clean_info)
+    if match:
+        group = match.lastgroup
+        beer_name = clean_info[:match.start(group)].strip()
+        brewery = match.group(group).strip()
+        remaining = clean_info[match.end(group):].strip()
+        return beer_name, brewery, remaining
+
+    # If no pattern matches, try generic approach
+    words = clean_info.split()
+    if len(words) > 4:
+        # Assume first few words are beer name
+        return (
+            ' '.join(words[:4]),
+            ' '.join(words[4:7]) if len(words) > 7 else ' '.join(words[4:]),
+            ' '.join(words[7:]) if len(words) > 7 else "",
+        )
+    return clean_info, "", ""
+
+
+def create_session(cache_dir: Path) -> requests.Session:
+    """
+    Build the HTTP session used for BeerAdvocate requests.
+
+    Args:
+        cache_dir: Directory holding the on-disk HTTP cache
+
+    Returns:
+        Configured session
+    """
+    # On-disk HTTP cache; honours Cache-Control and revalidates with
+    # ETag/Last-Modified, so re-runs mostly get 304s
+    session = CachedSession(
+        str(cache_dir / "beeradvocate_cache"),
+        backend="sqlite",
+        expire_after=3600,
+        cache_control=True,
+        stale_if_error=True,
+    )
+    session.headers.update(
+        {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            # requests decompresses transparently; "br" needs the brotli package
+            "Accept-Encoding": "gzip, deflate, br",
+            "Connection": "keep-alive",
+        }
+    )
+
+    # Pooled connections keep TLS alive across fetches; retry transient failures
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
 
 class BeerAdvocateScraper:
     """Main scraper class for BeerAdvocate beer listings."""
 
-    def __init__(self, base_url: str = "https://www.beeradvocate.com/beer/top-rated/"):
+    # Columns written to CSV, in order
+    OUTPUT_COLUMNS = [
+        "rank", "beer_name", "brewery", "style", "abv",
+        "num_ratings", "avg_rating", "description"
+    ]
+
+    def __init__(
+        self,
+        base_url: str = "https://www.beeradvocate.com/beer/top-rated/",
+        session: Optional[requests.Session] = None,
+    ):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-        )
-        
+        # Scheme and host, for resolving root-relative links without urljoin
+        base_parts = urlsplit(base_url)
+        self._site_root = f"{base_parts.scheme}://{base_parts.netloc}"
+
         # Set up directories relative to project root
         # Get the project root (2 levels up from src/ingest/)
         project_root = Path(__file__).parent.parent.parent
         self.data_dir = project_root / "data" / "raw"
+        self.cache_dir = project_root / "data" / "cache"
         self.log_dir = project_root / "logs"
         self._setup_directories()
+
+        # Reuse the caller's session (and its open connections) when given one
+        self.session = session or create_session(self.cache_dir)
+
+        # Parsed pages keyed by URL, with the validators needed to revalidate them
+        self._page_cache: Dict[str, Dict[str, Any]] = {}
         
         logger.info(f"Initialized scraper for: {base_url}")
 
     def _setup_directories(self) -> None:
         """Create necessary directories if they don't exist."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Data directory: {self.data_dir.absolute()}")
+        logger.info(f"Cache directory: {self.cache_dir.absolute()}")
         logger.info(f"Log directory: {self.log_dir.absolute()}")
 
-    def fetch_page(self, url: Optional[str] = None) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: Optional[str] = None) -> Optional[lxml_html.HtmlElement]:
         """
         Fetch and parse a web page.
 
@@ -51,124 +228,168 @@ class BeerAdvocateScraper:
             url: URL to fetch (defaults to base_url)
 
         Returns:
-            BeautifulSoup object or None if failed
+            Root element of the parsed page or None if failed
         """
         target_url = url or self.base_url
+        cached = self._page_cache.get(target_url)
+
+        # Revalidate a previously fetched page instead of downloading it again
+        conditional_headers = {}
+        if cached:
+            if cached["etag"]:
+                conditional_headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                conditional_headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
             logger.info(f"Fetching page: {target_url}")
-            response = self.session.get(target_url, timeout=10)
+            response = self.session.get(
+                target_url, timeout=10, headers=conditional_headers
+            )
+            if cached and response.status_code == 304:
+                logger.info(f"Page not modified, reusing cached parse: {target_url}")
+                return cached["root"]
+
             response.raise_for_status()
+            if getattr(response, "from_cache", False):
+                logger.info(f"Serving page from HTTP cache: {target_url}")
+
+            # The cached session has already read the whole body, so parse it in one call
+            try:
+                root = lxml_html.document_fromstring(response.content, parser=HTML_PARSER)
+            except etree.ParserError:
+                logger.error(f"Empty page returned: {target_url}")
+                return None
 
-            soup = BeautifulSoup(response.content, "html.parser")
             logger.success(
-                f"Successfully parsed page with {len(soup.find_all())} HTML elements"
+                f"Successfully parsed page with {int(root.xpath('count(//*)'))} HTML elements"
             )
 
-            return soup
+            self._page_cache[target_url] = {
+                "root": root,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            return root
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to fetch page: {e}")
             return None
 
-    def analyze_page_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _get_root(self) -> Optional[lxml_html.HtmlElement]:
+        """
+        Return the parsed base page, fetching it only on first use.
+
+        Returns:
+            Root element of the parsed page or None if failed
+        """
+        cached = self._page_cache.get(self.base_url)
+        if cached:
+            return cached["root"]
+        return self.fetch_page()
+
+    def analyze_page_structure(self, root: lxml_html.HtmlElement) -> Dict[str, Any]:
         """
         Analyze the basic structure of the page.
 
         Args:
-            soup: BeautifulSoup object
+            root: Root element of the parsed page
 
         Returns:
             Dictionary with page structure information
         """
-        if not soup:
-            logger.warning("No soup object provided for analysis")
+        if root is None:
+            logger.warning("No page provided for analysis")
             return {}
 
+        # Count every tag in a single walk of the tree (elements only, no comments)
+        tag_counts = Counter(element.tag for element in root.iter(etree.Element))
+        tables = list(root.iter("table"))
+
         # Basic page analysis
-        title_text = soup.title.string if soup.title and soup.title.string else "No title found"
+        title = root.find(".//title")
+        title_text = title.text if title is not None and title.text else "No title found"
         analysis = {
             "title": title_text,
-            "total_elements": len(soup.find_all()),
-            "tables_count": len(soup.find_all("table")),
-            "divs_count": len(soup.find_all("div")),
-            "links_count": len(soup.find_all("a")),
+            "total_elements": sum(tag_counts.values()),
+            "tables_count": tag_counts["table"],
+            "divs_count": tag_counts["div"],
+            "links_count": tag_counts["a"],
         }
 
         # Look for common table structures
-        tables = soup.find_all("table")
         if tables:
             analysis["table_info"] = []
             for i, table in enumerate(tables):
-                if isinstance(table, Tag):
-                    rows = table.find_all("tr")
-                    th_element = table.find("th")
-                    analysis["table_info"].append(
-                        {
-                            "table_index": i,
-                            "row_count": len(rows),
-                            "has_header": bool(th_element),
-                            "first_few_rows_text": [
-                                row.get_text()[:100] for row in rows[:3] if isinstance(row, Tag)
-                            ],
-                        }
-                    )
+                rows = ROWS_XPATH(table)
+                th_element = table.find(".//th")
+                analysis["table_info"].append(
+                    {
+                        "table_index": i,
+                        "row_count": len(rows),
+                        "has_header": th_element is not None,
+                        "first_few_rows_text": [
+                            row.text_content()[:100] for row in rows[:3]
+                        ],
+                    }
+                )
 
         logger.info(f"Page analysis complete: {analysis['title']}")
         return analysis
 
-    def find_beer_data_containers(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def find_beer_data_containers(self, root: lxml_html.HtmlElement) -> List[Dict[str, Any]]:
         """
         Identify potential containers holding beer data.
 
         Args:
-            soup: BeautifulSoup object
+            root: Root element of the parsed page
 
         Returns:
             List of potential data containers
         """
-        if not soup:
+        if root is None:
             return []
 
         # Look for common patterns in beer listing pages
         potential_containers: List[Dict[str, Any]] = []
 
+        # Collect tables and classed divs in a single walk of the tree
+        tables: List[lxml_html.HtmlElement] = []
+        divs: List[lxml_html.HtmlElement] = []
+        for element in root.iter("table", "div"):
+            if element.tag == "table":
+                tables.append(element)
+            elif element.get("class"):
+                divs.append(element)
+
         # Check for tables with beer-related content
-        tables = soup.find_all("table")
         for table in tables:
-            if isinstance(table, Tag):  # Type check for pylance
-                text_content = table.get_text().lower()
-                if any(
-                    keyword in text_content
-                    for keyword in ["beer", "brewery", "rating", "stout", "ipa"]
-                ):
-                    row_count = len(table.find_all("tr"))
-                    potential_containers.append(
-                        {
-                            "type": "table",
-                            "element": table,
-                            "row_count": row_count,
-                            "preview": text_content[:200],
-                        }
-                    )
+            text_content = table.text_content()
+            if CONTAINER_KEYWORDS_RE.search(text_content):
+                row_count = len(ROWS_XPATH(table))
+                potential_containers.append(
+                    {
+                        "type": "table",
+                        "element": table,
+                        "row_count": row_count,
+                        "preview": text_content[:200].lower(),
+                    }
+                )
 
         # Check for div containers with structured data
-        divs = soup.find_all("div", class_=True)
         for div in divs:
-            if isinstance(div, Tag):
-                class_list = div.get("class")
-                if class_list and isinstance(class_list, list) and any(
-                    "list" in cls.lower() or "beer" in cls.lower()
-                    for cls in class_list
-                ):
-                    potential_containers.append(
-                        {
-                            "type": "div",
-                            "element": div,
-                            "classes": class_list,
-                            "preview": div.get_text()[:200],
-                        }
-                    )
+            # Keywords contain no whitespace, so scanning the raw attribute is
+            # the same as checking each class name
+            class_attr = div.get("class")
+            if CLASS_KEYWORDS_RE.search(class_attr):
+                potential_containers.append(
+                    {
+                        "type": "div",
+                        "element": div,
+                        "classes": class_attr.split(),
+                        "preview": div.text_content()[:200],
+                    }
+                )
 
         logger.info(f"Found {len(potential_containers)} potential beer data containers")
         return potential_containers
@@ -182,13 +403,13 @@ class BeerAdvocateScraper:
         """
         logger.info("Starting page exploration...")
 
-        soup = self.fetch_page()
-        if not soup:
+        root = self._get_root()
+        if root is None:
             return {"error": "Failed to fetch page"}
 
         # Perform analysis
-        structure_info = self.analyze_page_structure(soup)
-        beer_containers = self.find_beer_data_containers(soup)
+        structure_info = self.analyze_page_structure(root)
+        beer_containers = self.find_beer_data_containers(root)
 
         exploration_results = {
             "page_structure": structure_info,
@@ -202,130 +423,107 @@ class BeerAdvocateScraper:
         logger.success("Page exploration completed")
         return exploration_results
 
-    def find_main_beer_table(self, soup: BeautifulSoup) -> Optional[Tag]:
+    def find_main_beer_table(
+        self, root: lxml_html.HtmlElement
+    ) -> Optional[lxml_html.HtmlElement]:
         """
         Locate the main table containing beer rankings.
 
         Args:
-            soup: BeautifulSoup object
+            root: Root element of the parsed page
 
         Returns:
             The main beer ranking table or None
         """
-        if not soup:
+        if root is None:
             return None
 
-        tables = soup.find_all("table")
-        logger.info(f"Found {len(tables)} tables on the page")
-
-        # Look for table with ranking structure
-        for i, table in enumerate(tables):
-            if isinstance(table, Tag):  # Type check for pylance
-                rows = table.find_all("tr")
-                if len(rows) > 10:  # Main table should have many rows
-                    # Check if it contains beer-related headers
-                    header_elements = table.find_all("th")
-                    header_text = " ".join([
-                        th.get_text() for th in header_elements 
-                        if isinstance(th, Tag)
-                    ])
-                    
-                    first_row = rows[0] if rows else None
-                    first_row_text = (
-                        first_row.get_text().lower() 
-                        if first_row and isinstance(first_row, Tag) 
-                        else ""
-                    )
-
-                    logger.info(f"Table {i}: {len(rows)} rows, header: '{header_text[:100]}'")
-
-                    if any(keyword in (header_text + first_row_text).lower()
-                           for keyword in ["rating", "beer", "brewery", "avg"]):
-                        logger.success(f"Identified main beer table: Table {i}")
-                        return table
+        # The whole selection runs in C: the first table with more than 10 rows
+        # whose headers, or failing that first row, mention a beer keyword
+        tables = MAIN_TABLE_XPATH(root, keywords=TABLE_KEYWORDS)
+        if not tables:
+            logger.warning("No table matches the beer ranking layout")
+            return None
 
-        return None
+        logger.success("Identified main beer table")
+        return tables[0]
 
-    def analyze_table_structure(self, table: Optional[Tag]) -> Dict[str, Any]:
+    def analyze_table_structure(
+        self, table: Optional[lxml_html.HtmlElement]
+    ) -> Dict[str, Any]:
         """
         Analyze the structure of the beer ranking table.
 
         Args:
-            table: BeautifulSoup table element
+            table: Table element
 
         Returns:
             Dictionary with table structure analysis
         """
-        if not table or not isinstance(table, Tag):
+        if table is None:
             return {}
 
-        rows = table.find_all("tr")
-        headers = table.find_all("th")
+        rows = ROWS_XPATH(table)
+        headers = table.xpath(".//th")
 
         analysis = {
             "total_rows": len(rows),
             "has_headers": len(headers) > 0,
             "header_count": len(headers),
-            "header_texts": [
-                th.get_text().strip() for th in headers 
-                if isinstance(th, Tag)
-            ],
+            "header_texts": [th.text_content().strip() for th in headers],
             "sample_rows": []
         }
 
         # Analyze first few data rows (skip header if present)
         start_idx = 1 if headers else 0
         for i in range(start_idx, min(start_idx + 5, len(rows))):
-            if i < len(rows):
-                row = rows[i]
-                if isinstance(row, Tag):
-                    cells = row.find_all(["td", "th"])
-                    cell_data = {
-                        "row_index": i,
-                        "cell_count": len(cells),
-                        "cell_texts": [
-                            cell.get_text().strip()[:50] for cell in cells 
-                            if isinstance(cell, Tag)
-                        ],
-                        "cell_html_preview": [
-                            str(cell)[:100] for cell in cells[:3] 
-                            if isinstance(cell, Tag)
-                        ]
-                    }
-                    analysis["sample_rows"].append(cell_data)
+            cells = CELLS_XPATH(rows[i])
+            cell_data = {
+                "row_index": i,
+                "cell_count": len(cells),
+                "cell_texts": [cell.text_content().strip()[:50] for cell in cells],
+                "cell_html_preview": [
+                    lxml_html.tostring(cell, encoding="unicode", with_tail=False)[:100]
+                    for cell in cells[:3]
+                ]
+            }
+            analysis["sample_rows"].append(cell_data)
 
         logger.info(f"Table analysis: {analysis['total_rows']} rows, {analysis['header_count']} headers")
         return analysis
 
-    def extract_beer_row_data(self, row: Union[Tag, Any], row_number: int) -> Optional[Dict[str, Any]]:
+    def extract_beer_row_data(
+        self, row: lxml_html.HtmlElement, row_number: int
+    ) -> Optional[Dict[str, Any]]:
         """
         Extract beer data from a single table row.
 
         Args:
-            row: BeautifulSoup row element
+            row: Table row element
             row_number: Row number for reference
 
         Returns:
             Dictionary with extracted beer data or None
         """
-        if not isinstance(row, Tag):
-            return None
-            
-        cells = row.find_all(["td", "th"])
+        cells = CELLS_XPATH(row)
         if len(cells) < 4:  # Need at least rank, beer info, ratings, avg
             return None
 
         try:
+            # Skip header row before reading the remaining cells
+            rank_text = cells[0].text_content().strip()
+            rank = _to_int(rank_text)
+            if rank is None or rank < 0:
+                return None
+
+            # Split the beer cell on <br> once; its text is the concatenation
+            beer_segments = self._split_on_br(cells[1])
+
             # Extract basic cell texts
-            cell_texts = [
-                cell.get_text().strip() for cell in cells 
-                if isinstance(cell, Tag)
+            cell_texts = [rank_text, "".join(beer_segments).strip()] + [
+                cell.text_content().strip() for cell in cells[2:]
             ]
 
-            # Skip header row
-            if not cell_texts[0].isdigit():
-                return None
-
             # Look for patterns in the data
             beer_data: Dict[str, Any] = {
                 "row_number": row_number,
@@ -334,29 +532,27 @@ class BeerAdvocateScraper:
             }
 
             # Extract rank (first column)
-            if cell_texts and cell_texts[0].isdigit():
-                beer_data["rank"] = int(cell_texts[0])
+            beer_data["rank"] = rank
 
             # Extract beer info from HTML structure (second column)
-            if len(cells) > 1 and isinstance(cells[1], Tag):
-                beer_cell = cells[1]
-                if isinstance(beer_cell, Tag):
-                    parsed_info = self._parse_beer_cell_html(beer_cell)
-                    beer_data.update(parsed_info)
+            # (len(cells) >= 4 is guaranteed above)
+            # Fill the row dictionary directly rather than merging a second one
+            self._parse_beer_cell_html(cells[1], beer_segments, parsed=beer_data)
 
             # Extract number of ratings (third column)
-            if len(cell_texts) > 2:
-                ratings_text = cell_texts[2]
-                clean_ratings = ratings_text.replace(',', '')
-                if clean_ratings.isdigit():
-                    beer_data["num_ratings"] = int(clean_ratings)
-                    beer_data["num_ratings_display"] = ratings_text
-
-            # Extract average rating (fourth column)
-            if len(cell_texts) > 3:
-                avg_text = cell_texts[3]
-                if re.match(r'^\d+\.\d+$', avg_text):
-                    beer_data["avg_rating"] = float(avg_text)
+            ratings_text = cell_texts[2]
+            num_ratings = _to_int(ratings_text)
+            if num_ratings is not None and num_ratings >= 0:
+                beer_data["num_ratings"] = num_ratings
+                beer_data["num_ratings_display"] = ratings_text
+
+            # Extract average rating (fourth column), on BeerAdvocate's 0-5 scale
+            try:
+                avg_rating = float(cell_texts[3])
+                if 0.0 <= avg_rating <= 5.0:
+                    beer_data["avg_rating"] = avg_rating
+            except ValueError:
+                pass
 
             return beer_data
 
@@ -364,7 +560,12 @@ class BeerAdvocateScraper:
             logger.warning(f"Error extracting data from row {row_number}: {e}")
             return None
 
-    def _parse_beer_cell_html(self, beer_cell: Tag) -> Dict[str, str]:
+    def _parse_beer_cell_html(
+        self,
+        beer_cell: lxml_html.HtmlElement,
+        segments: Optional[List[str]] = None,
+        parsed: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """
         Parse the beer info cell HTML to extract name, brewery, style, and ABV.
         
@@ -376,71 +577,118 @@ class BeerAdvocateScraper:
         - ABV percentage after |
         
         Args:
-            beer_cell: BeautifulSoup cell element containing beer info
+            beer_cell: Table cell element containing beer info
+            segments: Cell text already split on <br> tags, if the caller has it
+            parsed: Dictionary to add the fields to (a new one if omitted)
             
         Returns:
             Dictionary with parsed beer information
         """
-        parsed = {}
+        if parsed is None:
+            parsed = {}
         
         try:
-            # Get the raw HTML content
-            cell_html = str(beer_cell)
-            
             # Extract beer name from the link
-            beer_link = beer_cell.find('a')
-            if beer_link and isinstance(beer_link, Tag):
-                beer_name = beer_link.get_text().strip()
-                parsed["beer_name"] = beer_name
+            beer_link = beer_cell.find('.//a')
+            link_text = None
+            if beer_link is not None:
+                link_text = beer_link.text_content().strip()
+                parsed["beer_name"] = link_text
+                href = beer_link.get("href")
+                if href:
+                    parsed["beer_url"] = self._absolute_url(href)
             
-            # Get all text content and split by line breaks
-            full_text = beer_cell.get_text()
+            # Split the cell text on <br> tags once; the full text is their concatenation
+            if segments is None:
+                segments = self._split_on_br(beer_cell)
+            full_text = "".join(segments)
             
-            # Split by | to separate main info from ABV
-            if ' | ' in full_text:
-                main_part, abv_part = full_text.split(' | ', 1)
+            # Split by | to separate main info from ABV, in a single scan
+            pipe_match = PIPE_ABV_RE.search(full_text)
+            if pipe_match:
+                main_part = full_text[:pipe_match.start()]
                 # Extract ABV
-                abv_match = re.search(r'(\d+(?:\.\d+)?%)', abv_part)
-                if abv_match:
-                    parsed["abv"] = abv_match.group(1)
+                if pipe_match.group(1):
+                    parsed["abv"] = pipe_match.group(1)
             else:
                 main_part = full_text
             
             # Parse the main part using HTML structure
-            # Look for <br> tags to identify separate components
-            html_parts = str(beer_cell).split('<br/>')
+            # The <br> tags identify separate components
+            text_parts = [segment.strip() for segment in segments]
             
-            if len(html_parts) >= 3:
+            if len(text_parts) >= 3:
                 # First part contains beer name (with link)
-                beer_name_part = BeautifulSoup(html_parts[0], 'html.parser').get_text().strip()
-                if beer_link:
-                    parsed["beer_name"] = beer_link.get_text().strip()
+                if link_text is not None:
+                    parsed["beer_name"] = link_text
                 else:
-                    parsed["beer_name"] = beer_name_part
+                    parsed["beer_name"] = text_parts[0]
                 
                 # Second part contains brewery
-                brewery_part = BeautifulSoup(html_parts[1], 'html.parser').get_text().strip()
-                parsed["brewery"] = brewery_part
+                parsed["brewery"] = text_parts[1]
                 
                 # Third part contains style (may have ABV after |)
-                style_part = BeautifulSoup(html_parts[2], 'html.parser').get_text().strip()
-                if ' | ' in style_part:
-                    style_only = style_part.split(' | ')[0].strip()
-                    parsed["style"] = style_only
-                else:
-                    parsed["style"] = style_part
+                style_part = text_parts[2]
+                parsed["style"] = style_part.partition(' | ')[0].strip()
             else:
-                # Fallback: try to parse from text using the old method
+                # Fallback: try to parse from the plain text
                 fallback_parsed = self._parse_beer_info_fallback(main_part)
                 parsed.update(fallback_parsed)
                 
         except Exception as e:
             logger.warning(f"Error parsing beer cell HTML: {e}")
             # Fallback to basic text extraction
-            parsed["beer_name"] = beer_cell.get_text().strip()
+            parsed["beer_name"] = beer_cell.text_content().strip()
             
         return parsed
 
+    def _absolute_url(self, href: str) -> str:
+        """
+        Resolve a link found on the page against base_url.
+
+        Profile links are root-relative ("/beer/profile/..."), which only
+        need the site root prepended; urljoin is kept for everything else,
+        including paths with dot segments.
+
+        Args:
+            href: Link target as written in the page
+
+        Returns:
+            Absolute URL
+        """
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            return self._site_root + href
+        return urljoin(self.base_url, href)
+
+    def _split_on_br(self, cell: lxml_html.HtmlElement) -> List[str]:
+        """
+        Split the text of a cell into the segments separated by <br> tags.
+
+        Walks the already-parsed tree instead of serializing and re-parsing
+        the cell HTML.
+
+        Args:
+            cell: Table cell element
+
+        Returns:
+            Unstripped text of each segment, in document order
+        """
+        parts: List[List[str]] = [[cell.text or ""]]
+        for child in cell:
+            if child.tag == "br":
+                parts.append([])
+            elif child.find(".//br") is not None:
+                # Line breaks nested inside the child split it as well
+                first, *rest = self._split_on_br(child)
+                parts[-1].append(first)
+                parts.extend([segment] for segment in rest)
+            else:
+                # A child without line breaks contributes its whole text at once
+                parts[-1].append(child.text_content())
+            if child.tail:
+                parts[-1].append(child.tail)
+        return ["".join(part) for part in parts]
+
     def _parse_beer_info_fallback(self, beer_info: str) -> Dict[str, str]:
         """
         Fallback method to parse beer info from text when HTML parsing fails.
@@ -455,46 +703,13 @@ class BeerAdvocateScraper:
         
         try:
             # Remove extra whitespace and normalize
-            clean_info = re.sub(r'\s+', ' ', beer_info).strip()
+            clean_info = WS_RE.sub(' ', beer_info).strip()
             
-            # Common patterns for brewery names
-            brewery_patterns = [
-                r'(.*?)(Toppling Goliath Brewing Company)',
-                r'(.*?)(3 Floyds Brewing Co\.)',
-                r'(.*?)(Perennial Artisan Ales)',
-                r'(.*?)(Cigar City Brewing)',
-                r'(.*?)(The Alchemist)',
-                r'(.*?)(Tree House Brewing Company)',
-                r'(.*?)(\w+\s+Brewing\s+(?:Company|Co\.?))',
-                r'(.*?)(\w+\s+Brewery)',
-                r'(.*?)(Brasserie\s+\w+)',
-                r'(.*?)(Brouwerij\s+\w+)',
-            ]
-            
-            # Try to match brewery patterns
-            for pattern in brewery_patterns:
-                match = re.search(pattern, clean_info, re.IGNORECASE)
-                if match:
-                    beer_name = match.group(1).strip()
-                    brewery = match.group(2).strip()
-                    remaining = clean_info[match.end():].strip()
-                    
-                    parsed["beer_name"] = beer_name
-                    parsed["brewery"] = brewery
-                    parsed["style"] = remaining
-                    return parsed
-            
-            # If no pattern matches, try generic approach
-            words = clean_info.split()
-            if len(words) > 4:
-                # Assume first few words are beer name
-                parsed["beer_name"] = ' '.join(words[:4])
-                parsed["brewery"] = ' '.join(words[4:7]) if len(words) > 7 else ' '.join(words[4:])
-                parsed["style"] = ' '.join(words[7:]) if len(words) > 7 else ""
-            else:
-                parsed["beer_name"] = clean_info
-                parsed["brewery"] = ""
-                parsed["style"] = ""
+            # Repeated breweries/styles make the same text come up often
+            beer_name, brewery, style = _split_beer_info(clean_info)
+            parsed["beer_name"] = beer_name
+            parsed["brewery"] = brewery
+            parsed["style"] = style
                 
         except Exception as e:
             logger.warning(f"Error in fallback parsing: {e}")
@@ -504,52 +719,107 @@ class BeerAdvocateScraper:
             
         return parsed
 
-    def _parse_beer_info(self, beer_info: str) -> Dict[str, str]:
+    def _iter_beers(
+        self, table: Optional[lxml_html.HtmlElement], max_beers: Optional[int] = 250
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Parse the beer info string to extract name, brewery, style, and ABV.
-        
-        This method is deprecated in favor of HTML structure parsing.
-        """
-        # Use the fallback method
-        return self._parse_beer_info_fallback(beer_info)
-        
-    def _extract_beer_components(self, main_info: str) -> Dict[str, str]:
+        Yield beers from the rankings table as their rows are extracted.
+
+        Args:
+            table: Main beer ranking table, as found by find_main_beer_table
+            max_beers: Stop once this many beers are extracted (None for no limit)
+
+        Yields:
+            Beer data dictionaries, in table order
         """
-        Extract beer name, brewery, and style from concatenated text.
+        if table is None:
+            logger.error("Could not find main beer table")
+            return
+
+        rows = ROWS_XPATH(table)
+        extracted = 0
         
-        This method is deprecated in favor of HTML structure parsing.
-        """
-        # Use the fallback method
-        return self._parse_beer_info_fallback(main_info)
+        logger.info(f"Processing {len(rows)} rows from beer table")
+
+        for i, row in enumerate(rows):
+            beer_data = self.extract_beer_row_data(row, i)
+            if beer_data and "rank" in beer_data:  # Only include valid beer rows
+                yield beer_data
+                extracted += 1
+                # Skip trailing footer/pagination rows once the ranking is complete
+                if max_beers is not None and extracted >= max_beers:
+                    break
+                    
+        logger.success(f"Successfully extracted {extracted} beers")
 
-    def extract_all_beers(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def extract_all_beers(
+        self, root: lxml_html.HtmlElement, max_beers: Optional[int] = 250
+    ) -> List[Dict[str, Any]]:
         """
         Extract all 250 beers from the rankings table.
         
         Args:
-            soup: BeautifulSoup object
+            root: Root element of the parsed page
+            max_beers: Stop once this many beers are extracted (None for no limit)
             
         Returns:
             List of all beer data dictionaries
         """
-        table = self.find_main_beer_table(soup)
-        if not table or not isinstance(table, Tag):
-            logger.error("Could not find main beer table")
-            return []
+        return self.extract_all_beers_from_table(self.find_main_beer_table(root), max_beers)
 
-        rows = table.find_all("tr")
-        all_beers = []
-        
-        logger.info(f"Processing {len(rows)} rows from beer table")
+    def extract_all_beers_from_table(
+        self, table: Optional[lxml_html.HtmlElement], max_beers: Optional[int] = 250
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract beers from an already located rankings table.
 
-        for i, row in enumerate(rows):
-            if isinstance(row, Tag):
-                beer_data = self.extract_beer_row_data(row, i)
-                if beer_data and "rank" in beer_data:  # Only include valid beer rows
-                    all_beers.append(beer_data)
-                    
-        logger.success(f"Successfully extracted {len(all_beers)} beers")
-        return all_beers
+        Args:
+            table: Main beer ranking table, as found by find_main_beer_table
+            max_beers: Stop once this many beers are extracted (None for no limit)
+
+        Returns:
+            List of all beer data dictionaries
+        """
+        return list(self._iter_beers(table, max_beers))
+
+    def extract_all_beers_soa(
+        self, root: lxml_html.HtmlElement, max_beers: Optional[int] = 250
+    ) -> Dict[str, List[Any]]:
+        """
+        Extract beers straight into one list per output column.
+
+        Row dictionaries are dropped as soon as their values are appended, so
+        the full list of beers is never held in memory.
+
+        Args:
+            root: Root element of the parsed page
+            max_beers: Stop once this many beers are extracted (None for no limit)
+
+        Returns:
+            Mapping of column name to column values, as from _to_columns
+        """
+        return self._to_columns(self._iter_beers(self.find_main_beer_table(root), max_beers))
+
+    def _to_columns(self, beer_data: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Transpose beer data into one list per output column, in a single pass.
+
+        Only the output columns that appear in the data are kept, in output
+        order; beers missing a field get None in that column.
+
+        Args:
+            beer_data: Beer dictionaries (any iterable, consumed once)
+
+        Returns:
+            Mapping of column name to column values
+        """
+        present = set()
+        columns: Dict[str, List[Any]] = {col: [] for col in self.OUTPUT_COLUMNS}
+        for beer in beer_data:
+            present.update(beer.keys())
+            for col, values in columns.items():
+                values.append(beer.get(col))
+        return {col: values for col, values in columns.items() if col in present}
 
     def _save_to_csv(self, beer_data: List[Dict[str, Any]], filename: str) -> None:
         """
@@ -559,27 +829,44 @@ class BeerAdvocateScraper:
             beer_data: List of beer dictionaries
             filename: Output filename
         """
+        # Only include columns that exist, in output order
+        self._save_columns_to_csv(self._to_columns(beer_data), filename)
+
+    def _save_columns_to_csv(self, columns: Dict[str, List[Any]], filename: str) -> None:
+        """
+        Save column-wise beer data to CSV file in the data directory.
+
+        Args:
+            columns: Mapping of column name to column values
+            filename: Output filename
+        """
         try:
-            df = pd.DataFrame(beer_data)
-            
-            # Select and order columns for output
-            output_columns = [
-                "rank", "beer_name", "brewery", "style", "abv", 
-                "num_ratings", "avg_rating"
-            ]
-            
-            # Only include columns that exist
-            available_columns = [col for col in output_columns if col in df.columns]
-            df_output = df[available_columns]
-            
             # Save to data directory
             filepath = self.data_dir / filename
-            df_output.to_csv(filepath, index=False)
-            logger.success(f"Saved {len(beer_data)} beers to {filepath}")
+            with open(filepath, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(columns.keys())
+                writer.writerows(zip(*columns.values()))
+            row_count = len(next(iter(columns.values()), []))
+            logger.success(f"Saved {row_count} beers to {filepath}")
             
         except Exception as e:
             logger.error(f"Error saving to CSV: {e}")
 
+    def to_df(self, beer_data: List[Dict[str, Any]]) -> "pd.DataFrame":
+        """
+        Convert beer data to a DataFrame with the same columns as the CSV output.
+
+        Args:
+            beer_data: List of beer dictionaries
+
+        Returns:
+            DataFrame of beers
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self._to_columns(beer_data))
+
     def scrape_top_beers(self, save_to_file: bool = True, custom_filename: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Main method to scrape all top-rated beers.
@@ -593,13 +880,13 @@ class BeerAdvocateScraper:
         """
         logger.info("Starting complete beer data extraction...")
         
-        soup = self.fetch_page()
-        if not soup:
+        root = self._get_root()
+        if root is None:
             logger.error("Failed to fetch page")
             return []
             
         # Extract all beers
-        all_beers = self.extract_all_beers(soup)
+        all_beers = self.extract_all_beers(root)
         
         if save_to_file and all_beers:
             # Determine filename based on URL
@@ -612,6 +899,130 @@ class BeerAdvocateScraper:
         logger.success(f"Scraping completed. Extracted {len(all_beers)} beers")
         return all_beers
 
+    async def _fetch_many(
+        self, urls: List[str], concurrency: int = 10, rate: float = 5.0
+    ) -> List[Optional[bytes]]:
+        """
+        Download several pages concurrently.
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of requests in flight
+            rate: Maximum number of requests started per second, retries included
+
+        Returns:
+            Page bodies in the same order as urls, None for failed fetches
+        """
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(concurrency)
+        pacer = RequestPacer(1 / rate)
+        connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        headers = {"User-Agent": self.session.headers["User-Agent"]}
+
+        async with aiohttp.ClientSession(
+            headers=headers, connector=connector, timeout=timeout
+        ) as session:
+
+            async def fetch(url: str) -> Optional[bytes]:
+                async with semaphore:
+                    try:
+                        return await read_with_retry(
+                            session,
+                            url,
+                            RETRY_TOTAL,
+                            RETRY_BACKOFF,
+                            RETRY_STATUSES,
+                            pacer=pacer,
+                        )
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        logger.warning(f"Failed to fetch detail page {url}: {e}")
+                        return None
+
+            return await asyncio.gather(*(fetch(url) for url in urls))
+
+    def _parse_beer_detail(self, root: lxml_html.HtmlElement) -> Dict[str, str]:
+        """
+        Extract enrichment fields from a beer profile page.
+
+        Args:
+            root: Root element of the parsed beer profile page
+
+        Returns:
+            Dictionary with detail fields
+        """
+        detail = {}
+        description = root.xpath('//meta[@name="description"]/@content')
+        if description and description[0].strip():
+            detail["description"] = description[0].strip()
+        return detail
+
+    async def _detailed_async(
+        self, beers: List[Dict[str, Any]], concurrency: int, rate: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Enrich beers in place with data from their profile pages.
+
+        Args:
+            beers: Beer dictionaries as returned by extract_all_beers
+            concurrency: Maximum number of requests in flight
+            rate: Maximum number of requests started per second
+
+        Returns:
+            The enriched list of beers
+        """
+        with_url = [beer for beer in beers if beer.get("beer_url")]
+        logger.info(f"Fetching {len(with_url)} beer detail pages (concurrency={concurrency})")
+
+        pages = await self._fetch_many(
+            [beer["beer_url"] for beer in with_url], concurrency=concurrency, rate=rate
+        )
+
+        enriched = 0
+        for beer, content in zip(with_url, pages):
+            if content:
+                beer.update(
+                    self._parse_beer_detail(lxml_html.fromstring(content, parser=HTML_PARSER))
+                )
+                enriched += 1
+
+        logger.success(f"Enriched {enriched}/{len(with_url)} beers with detail pages")
+        return beers
+
+    def scrape_top_beers_detailed(
+        self,
+        concurrency: int = 10,
+        rate: float = 5.0,
+        save_to_file: bool = True,
+        custom_filename: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape the listing and enrich every beer with its profile page.
+
+        Args:
+            concurrency: Maximum number of detail requests in flight
+            rate: Maximum number of detail requests started per second
+            save_to_file: Whether to save results to CSV
+            custom_filename: Custom filename for output
+
+        Returns:
+            List of all beer data, including detail fields
+        """
+        all_beers = self.scrape_top_beers(save_to_file=False)
+        if not all_beers:
+            return []
+
+        all_beers = asyncio.run(self._detailed_async(all_beers, concurrency, rate))
+
+        if save_to_file:
+            filename = custom_filename or self._get_filename_from_url().replace(
+                ".csv", "_detailed.csv"
+            )
+            self._save_to_csv(all_beers, filename)
+
+        return all_beers
+
     def _get_filename_from_url(self) -> str:
         """
         Generate appropriate filename based on the URL being scraped.
@@ -637,19 +1048,19 @@ class BeerAdvocateScraper:
         """
         logger.info("Starting comprehensive page analysis...")
 
-        soup = self.fetch_page()
-        if not soup:
+        root = self._get_root()
+        if root is None:
             return {"error": "Failed to fetch page"}
 
         # Basic structure analysis
-        structure = self.analyze_page_structure(soup)
+        structure = self.analyze_page_structure(root)
 
-        # Find and analyze main table
-        main_table = self.find_main_beer_table(soup)
-        table_analysis = self.analyze_table_structure(main_table) if main_table else {}
+        # Find the main table once; both the analysis and the samples use it
+        main_table = self.find_main_beer_table(root)
+        table_analysis = self.analyze_table_structure(main_table)
 
-        # Extract sample data
-        sample_beers = self.extract_all_beers(soup)[:15]  # Get first 15 beers as samples
+        # Extract sample data, stopping after 15 beers
+        sample_beers = self.extract_all_beers_from_table(main_table, max_beers=15)
 
         results = {
             "page_structure": structure,
@@ -720,18 +1131,29 @@ class MultiEndpointScraper:
         "popular": "https://www.beeradvocate.com/beer/popular/",
         "worst": "https://www.beeradvocate.com/beer/worst/"
     }
+
+    OUTPUT_FILES = {
+        "top_rated": "top_250_beers.csv",
+        "popular": "popular_beers.csv",
+        "worst": "worst_beers.csv"
+    }
     
     def __init__(self):
         # Set up directories relative to project root
         # Get the project root (2 levels up from src/ingest/)
         project_root = Path(__file__).parent.parent.parent
         self.data_dir = project_root / "data" / "raw"
+        self.cache_dir = project_root / "data" / "cache"
         self.log_dir = project_root / "logs"
         self._setup_directories()
+
+        # One session for every endpoint, so same-host requests share connections
+        self.session = create_session(self.cache_dir)
         
     def _setup_directories(self) -> None:
         """Create necessary directories if they don't exist."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         
     def setup_logging(self, endpoint_name: str) -> None:
@@ -757,15 +1179,10 @@ class MultiEndpointScraper:
         logger.info(f"Starting scrape of {endpoint_name} endpoint: {url}")
         
         # Create scraper for this endpoint
-        scraper = BeerAdvocateScraper(url)
+        scraper = BeerAdvocateScraper(url, session=self.session)
         
         # Determine filename
-        filename_mapping = {
-            "top_rated": "top_250_beers.csv",
-            "popular": "popular_beers.csv", 
-            "worst": "worst_beers.csv"
-        }
-        filename = filename_mapping[endpoint_name]
+        filename = self.OUTPUT_FILES[endpoint_name]
         
         # Scrape the data
         try:
@@ -779,29 +1196,46 @@ class MultiEndpointScraper:
     def scrape_all_endpoints(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Scrape all configured endpoints.
+
+        The pages are downloaded concurrently rather than one after another.
         
         Returns:
             Dictionary mapping endpoint names to beer data
         """
-        all_results = {}
-        
+        # Setup logging for every endpoint up front, since they run together
         for endpoint_name in self.ENDPOINTS.keys():
+            self.setup_logging(endpoint_name)
+
+        scrapers = {
+            name: BeerAdvocateScraper(url, session=self.session)
+            for name, url in self.ENDPOINTS.items()
+        }
+
+        # Every fetch goes through the shared cached session, so the HTTP cache
+        # and ETag revalidation still apply; threads only overlap the downloads
+        with ThreadPoolExecutor(max_workers=MAX_ENDPOINT_WORKERS) as pool:
+            roots = list(pool.map(BeerAdvocateScraper.fetch_page, scrapers.values()))
+
+        all_results = {}
+        for (endpoint_name, scraper), root in zip(scrapers.items(), roots):
             logger.info(f"\n{'='*50}")
             logger.info(f"SCRAPING {endpoint_name.upper().replace('_', ' ')} BEERS")
             logger.info(f"{'='*50}")
-            
-            # Setup logging for this endpoint
-            self.setup_logging(endpoint_name)
-            
-            # Scrape the endpoint
-            beer_data = self.scrape_endpoint(endpoint_name)
+
+            if root is None:
+                all_results[endpoint_name] = []
+                continue
+
+            try:
+                beer_data = scraper.extract_all_beers(root)
+                if beer_data:
+                    scraper._save_to_csv(beer_data, self.OUTPUT_FILES[endpoint_name])
+                logger.success(f"Successfully scraped {len(beer_data)} beers from {endpoint_name}")
+            except Exception as e:
+                logger.error(f"Error scraping {endpoint_name}: {e}")
+                beer_data = []
             all_results[endpoint_name] = beer_data
-            
-            # Brief pause between endpoints
-            if endpoint_name != list(self.ENDPOINTS.keys())[-1]:  # Not the last one
-                logger.info("Pausing between endpoints...")
-                time.sleep(2)
-                
+
         return all_results
         
     def generate_summary_report(self, results: Dict[str, List[Dict[str, Any]]]) -> None:
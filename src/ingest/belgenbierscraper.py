@@ -3,16 +3,167 @@ Belgian Beer Scraper
 A modular scraper to extract beer data from Belgenbier.be's beer listing pages.
 """
 
+import asyncio
+import csv
+import gzip
+import multiprocessing
+import os
+import aiohttp
 import requests
-from bs4 import BeautifulSoup, Tag
-from bs4.element import PageElement, NavigableString
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from lxml import etree, html as lxml_html
 import re
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from loguru import logger
 import time
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
+
+from src.util.async_http import RequestPacer, read_with_retry
+
+# One lxml parser for every page; comments are dropped at parse time so they
+# never show up in cell text
+HTML_PARSER = lxml_html.HTMLParser(remove_comments=True)
+
+# Table lookups and pagination run as XPath, so the tree walks stay in C
+MAIN_TABLE_BGCOLOR = "#E8E8E8"
+MAIN_TABLE_XPATH = etree.XPath(f'(//table[@bgcolor="{MAIN_TABLE_BGCOLOR}"])[1]')
+CELLS_XPATH = etree.XPath(".//td")
+# Only the elements whose own text mentions "Pagina", outside <script>/<style>,
+# so the page counter is found without joining the whole document's text
+PAGINA_ELEMENTS_XPATH = etree.XPath(
+    '//*[not(self::script or self::style)][text()[contains(., "Pagina")]]'
+)
+NEXT_LINK_XPATH = etree.XPath(
+    '//a[re:test(., "Next page", "i")][1]/@href',
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+# Per-cell patterns, compiled once since they run on every <td> of every page
+SKIP_PATTERN = r"(?:page \d+|\[.*\]|vorige pagina|next page|zoek|search|naam bier|er zijn momenteel|webmaster)"
+SKIP_RE = re.compile(SKIP_PATTERN, re.IGNORECASE)
+BEER_CELL_RE = re.compile(r"^(.+?)\s*\(([^)]+)\)(.*)$")
+# Skip check and beer match in one pass, for cell text that is already stripped
+BEER_ROW_RE = re.compile(rf"^(?!(?i:{SKIP_PATTERN}))(.+?)\s*\(([^)]+)\)(.*)$")
+OUT_OF_PRODUCTION_RE = re.compile(r"\s*-\s*uit productie", re.IGNORECASE)
+
+# Page counter text, e.g. "Pagina 1 van 237"
+PAGINA_RE = re.compile(r"Pagina\s+\d+\s+van\s+(\d+)")
+
+# Page-number query parameter in a 'Next page' link from the first page
+PAGE_PARAM_RE = re.compile(r"[?&][^=&#]*pag[^=&#]*=(2)(?=[&#]|$)", re.IGNORECASE)
+
+# Connection pool and retry policy for the requests session
+POOL_SIZE = 20
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Bytes fed to the pull parser at a time when looking for the main table
+PARSE_CHUNK_SIZE = 16384
+
+# Output buffer for CSV writes, so rows go to disk in large blocks
+CSV_BUFFER_SIZE = 1 << 20
+# Fast gzip level for compressed output; the ratio is close to the default's
+GZIP_LEVEL = 3
+# Logical column order of the CSV output
+COLUMN_ORDER = (
+    "beer_id",
+    "beer_name",
+    "brewery",
+    "production_status",
+    "notes",
+    "source_page",
+    "raw_text",
+)
+
+
+def _cell_text(cell: lxml_html.HtmlElement) -> str:
+    """
+    Join the stripped text pieces of a cell, like BeautifulSoup's get_text(strip=True).
+
+    Args:
+        cell: The table cell element.
+
+    Returns:
+        The cell text.
+    """
+    # map() keeps the per-piece strip in C rather than a generator frame
+    return "".join(map(str.strip, cell.itertext()))
+
+
+def _parse_listing_page(content: bytes) -> lxml_html.HtmlElement:
+    """
+    Parse a listing page only as far as its main beer table.
+
+    The page is fed to a pull parser in chunks and parsing stops once the
+    main table is closed, so the rest of the document is never built.
+    Tables outside it are emptied as soon as they end. If no main table
+    turns up, the page is parsed in full so the keyword fallback still works.
+
+    Args:
+        content: Raw HTML of the page.
+
+    Returns:
+        Root element of the (possibly partial) parsed page.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="table", remove_comments=True)
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+
+    for start in range(0, len(content), PARSE_CHUNK_SIZE):
+        parser.feed(content[start : start + PARSE_CHUNK_SIZE])
+        for _, table in parser.read_events():
+            if table.get("bgcolor") == MAIN_TABLE_BGCOLOR:
+                return table.getroottree().getroot()
+            # Nested tables may still belong to the main table
+            if next(table.iterancestors("table"), None) is None:
+                table.clear(keep_tail=True)
+
+    return lxml_html.fromstring(content, parser=HTML_PARSER)
+
+
+def parse_page(content: bytes, keep_raw_text: bool = False) -> List[Dict[str, Any]]:
+    """
+    Parse a listing page and extract its beer cells, duplicates included.
+
+    Kept at module level and free of scraper state so it can be pickled
+    and run in a worker process.
+
+    Args:
+        content: Raw HTML of the page.
+        keep_raw_text: Whether to keep each cell's full text under "raw_text".
+
+    Returns:
+        A list of beer dictionaries in page order.
+    """
+    return BelgenBierScraper._page_beers(_parse_listing_page(content), keep_raw_text)
+
+
+def _dedupe_beers(
+    beers: Iterable[Dict[str, Any]], seen_beers: set[tuple[str, str]]
+) -> List[Dict[str, Any]]:
+    """
+    Keep the beers whose key is not in seen_beers, adding their keys to it.
+
+    Args:
+        beers: Beer dictionaries to filter.
+        seen_beers: Lowercased (beer_name, brewery) keys already collected.
+            Updated in place.
+
+    Returns:
+        The beers not seen before, in their original order.
+    """
+    new_beers = []
+    for beer in beers:
+        beer_key = (beer["beer_name"].lower(), beer["brewery"].lower())
+        if beer_key not in seen_beers:
+            seen_beers.add(beer_key)
+            new_beers.append(beer)
+    return new_beers
 
 
 class BelgenBierScraper:
@@ -21,21 +172,39 @@ class BelgenBierScraper:
     """
 
     def __init__(
-        self, base_url: str = "https://www.belgenbier.be/bieren/bieren.php"
+        self,
+        base_url: str = "https://www.belgenbier.be/bieren/bieren.php",
+        keep_raw_text: bool = False,
     ) -> None:
         """
         Initialize the Belgian beer scraper.
 
         Args:
             base_url: Base URL for the Belgian beer database.
+            keep_raw_text: Keep each cell's full text as a "raw_text" column,
+                e.g. for debugging the cell parsing.
         """
         self.base_url = base_url
+        self.keep_raw_text = keep_raw_text
         self.session = requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
         )
+        # Retry transient failures instead of aborting a long paginated run
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(["GET"]),
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self._setup_directories()
         logger.info(f"Initialized Belgian beer scraper for: {self.base_url}")
@@ -52,7 +221,7 @@ class BelgenBierScraper:
         logger.info(f"Data directory: {self.data_dir}")
         logger.info(f"Log directory: {self.log_dir}")
 
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[lxml_html.HtmlElement]:
         """
         Fetch and parse a specific page from the Belgian beer database.
 
@@ -60,54 +229,55 @@ class BelgenBierScraper:
             url: The URL of the page to fetch.
 
         Returns:
-            BeautifulSoup object of the parsed page, or None if it failed.
+            Root element of the parsed page, or None if it failed.
         """
         logger.info(f"Fetching page: {url}")
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            tree = lxml_html.fromstring(response.content, parser=HTML_PARSER)
             logger.success(
-                f"Successfully parsed page with {len(soup.find_all())} HTML elements"
+                f"Successfully parsed page with {int(tree.xpath('count(//*)'))} HTML elements"
             )
-            return soup
+            return tree
 
         except requests.RequestException as e:
             logger.error(f"Failed to fetch page {url}: {e}")
             return None
+        except etree.ParserError as e:
+            logger.error(f"Failed to parse page {url}: {e}")
+            return None
 
-    def find_main_beer_table(self, soup: BeautifulSoup) -> Optional[Tag]:
+    @staticmethod
+    def find_main_beer_table(
+        tree: lxml_html.HtmlElement,
+    ) -> Optional[lxml_html.HtmlElement]:
         """
         Find the main table containing beer data.
 
         Args:
-            soup: The BeautifulSoup object of the page.
+            tree: Root element of the parsed page.
 
         Returns:
-            The BeautifulSoup Tag of the table, or None if not found.
+            The table element, or None if not found.
         """
         # The main content table seems to be the first one with a specific bgcolor
-        tables = soup.find_all("table", {"bgcolor": "#E8E8E8"})
+        tables = MAIN_TABLE_XPATH(tree)
 
         if tables:
-            first_table = tables[0]
-            if isinstance(first_table, Tag):
-                logger.success("Identified main beer table based on bgcolor attribute.")
-                return first_table
+            logger.success("Identified main beer table based on bgcolor attribute.")
+            return tables[0]
 
         logger.warning(
             "Could not find the primary table. Falling back to keyword search."
         )
 
         # Fallback if the bgcolor changes
-        for i, table in enumerate(soup.find_all("table")):
-            if not isinstance(table, Tag):
-                continue
-
-            rows = table.find_all("tr")
+        for i, table in enumerate(tree.iter("table")):
+            rows = table.xpath(".//tr")
             if len(rows) > 10:  # Assume the main table has a good number of rows
-                table_text = table.get_text(strip=True).lower()
+                table_text = _cell_text(table).lower()
                 if any(
                     indicator in table_text
                     for indicator in ["bier", "brouwerij", "uit productie"]
@@ -130,21 +300,37 @@ class BelgenBierScraper:
         Returns:
             A dictionary with beer data or None if not a valid beer entry.
         """
-        if not cell_text or len(cell_text.strip()) < 3:
+        stripped = cell_text.strip() if cell_text else ""
+        if len(stripped) < 3:
             return None
 
-        # Pattern to skip common non-beer text
-        skip_patterns = r"^(page \d+|\[.*\]|vorige pagina|next page|zoek|search|naam bier|er zijn momenteel|webmaster)"
-        if re.match(skip_patterns, cell_text.lower()):
+        # Skip common non-beer text
+        if SKIP_RE.match(cell_text):
             return None
 
-        # Pattern to extract: Beer Name (Brewery) - Optional Status (Optional Info)
-        pattern = r"^(.+?)\s*\(([^)]+)\)(.*)$"
-        match = re.match(pattern, cell_text.strip())
+        # Extract: Beer Name (Brewery) - Optional Status (Optional Info)
+        match = BEER_CELL_RE.match(stripped)
 
         if not match:
             return None
 
+        return self._beer_from_match(match, cell_text, self.keep_raw_text)
+
+    @staticmethod
+    def _beer_from_match(
+        match: re.Match, cell_text: str, keep_raw_text: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build a beer dictionary from a matched beer cell.
+
+        Args:
+            match: Match of BEER_CELL_RE or BEER_ROW_RE on the cell text.
+            cell_text: The raw text from the table cell.
+            keep_raw_text: Whether to keep cell_text under "raw_text".
+
+        Returns:
+            A dictionary with beer data.
+        """
         beer_name = match.group(1).strip()
         brewery = match.group(2).strip()
         remainder = match.group(3).strip()
@@ -153,58 +339,74 @@ class BelgenBierScraper:
         if "uit productie" in remainder.lower():
             production_status = "Uit productie"
             # Clean the status from the remainder
-            remainder = re.sub(
-                r"\s*-\s*uit productie", "", remainder, flags=re.IGNORECASE
-            ).strip()
+            remainder = OUT_OF_PRODUCTION_RE.sub("", remainder).strip()
 
-        return {
+        beer = {
             "beer_name": beer_name,
             "brewery": brewery,
             "production_status": production_status,
             "notes": remainder.strip(),
-            "raw_text": cell_text,
         }
-
-    def extract_beers_from_page(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        # The cell text is recoverable from the other fields, so it is opt-in
+        if keep_raw_text:
+            beer["raw_text"] = cell_text
+        return beer
+
+    @staticmethod
+    def _page_beers(
+        tree: lxml_html.HtmlElement, keep_raw_text: bool = False
+    ) -> List[Dict[str, Any]]:
         """
-        Extracts all unique beer data from a single parsed page.
+        Extract every beer cell from a single parsed page, duplicates included.
 
         Args:
-            soup: The BeautifulSoup object for the page.
+            tree: Root element of the parsed page.
+            keep_raw_text: Whether to keep each cell's text under "raw_text".
 
         Returns:
-            A list of dictionaries, where each dictionary is a unique beer.
+            A list of beer dictionaries in page order.
         """
-        main_table = self.find_main_beer_table(soup)
-        if not main_table:
+        main_table = BelgenBierScraper.find_main_beer_table(tree)
+        if main_table is None:
             return []
 
-        beers: List[Dict[str, Any]] = []
-        seen_beers: set[tuple[str, str]] = set()  # Track (beer_name, brewery)
+        # Collect every cell's text first, then keep only the beer cells
+        texts = [_cell_text(cell) for cell in CELLS_XPATH(main_table)]
+        return [
+            BelgenBierScraper._beer_from_match(match, cell_text, keep_raw_text)
+            for cell_text, match in zip(texts, map(BEER_ROW_RE.match, texts))
+            if match
+        ]
 
-        for cell in main_table.find_all("td"):
-            cell_text = cell.get_text(strip=True)
-            beer_data = self.extract_beer_data_from_cell(cell_text)
+    def extract_beers_from_page(
+        self,
+        tree: lxml_html.HtmlElement,
+        seen_beers: Optional[set[tuple[str, str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extracts all unique beer data from a single parsed page.
 
-            if beer_data:
-                beer_key = (
-                    beer_data["beer_name"].lower(),
-                    beer_data["brewery"].lower(),
-                )
+        Args:
+            tree: Root element of the parsed page.
+            seen_beers: Lowercased (beer_name, brewery) keys already collected,
+                e.g. from earlier pages. Updated in place with this page's beers.
 
-                if beer_key not in seen_beers:
-                    seen_beers.add(beer_key)
-                    beers.append(beer_data)
+        Returns:
+            A list of dictionaries, where each dictionary is a beer not seen before.
+        """
+        if seen_beers is None:
+            seen_beers = set()  # Track (beer_name, brewery)
 
-        logger.info(f"Extracted {len(beers)} unique beers from the page.")
+        beers = _dedupe_beers(self._page_beers(tree, self.keep_raw_text), seen_beers)
+        logger.info(f"Extracted {len(beers)} new unique beers from the page.")
         return beers
 
-    def get_pagination_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def get_pagination_info(self, tree: lxml_html.HtmlElement) -> Dict[str, Any]:
         """
         Extract pagination information to find the next page URL.
 
         Args:
-            soup: The BeautifulSoup object of the page.
+            tree: Root element of the parsed page.
 
         Returns:
             A dictionary with pagination details.
@@ -212,14 +414,16 @@ class BelgenBierScraper:
         pagination_info = {"has_next": False, "next_url": None, "total_pages": 1}
 
         # Find total pages from text like "Pagina 1 van 237"
-        page_text_match = re.search(r"Pagina\s+\d+\s+van\s+(\d+)", soup.get_text())
-        if page_text_match:
-            pagination_info["total_pages"] = int(page_text_match.group(1))
+        for element in PAGINA_ELEMENTS_XPATH(tree):
+            page_text_match = PAGINA_RE.search(element.text_content())
+            if page_text_match:
+                pagination_info["total_pages"] = int(page_text_match.group(1))
+                break
 
         # Find the "Next page" link
-        next_link_tag = soup.find("a", string=re.compile(r"Next page", re.IGNORECASE))
-        if next_link_tag and isinstance(next_link_tag, Tag):
-            href = next_link_tag.get("href")
+        next_hrefs = NEXT_LINK_XPATH(tree)
+        if next_hrefs:
+            href = next_hrefs[0]
             if href:
                 next_href = str(href)
                 # Construct absolute URL if it's relative
@@ -238,107 +442,257 @@ class BelgenBierScraper:
 
         return pagination_info
 
-    def scrape_all_pages(
-        self, max_pages: Optional[int] = None, delay: float = 1.0
-    ) -> List[Dict[str, Any]]:
+    def _remaining_page_urls(
+        self, pagination: Dict[str, Any], max_pages: Optional[int]
+    ) -> Optional[List[str]]:
         """
-        Scrape multiple pages by following the 'Next page' link.
+        Build the URLs of pages 2..N from the first page's pagination info.
 
         Args:
+            pagination: Pagination details of the first page.
             max_pages: Maximum number of pages to scrape. Scrapes all if None.
-            delay: Seconds to wait between page requests.
 
         Returns:
-            A list of all unique beer data found across all pages.
+            The remaining page URLs in order, or None if the next-page link
+            has no recognisable page number to substitute.
         """
-        all_beers: List[Dict[str, Any]] = []
-        seen_beers: set[tuple[str, str]] = set()
+        next_url = pagination["next_url"]
+        if not next_url or pagination["total_pages"] <= 1:
+            return None
+
+        match = PAGE_PARAM_RE.search(next_url)
+        if not match:
+            return None
 
-        current_url: Optional[str] = self.base_url
-        page_count = 0
+        last_page = pagination["total_pages"]
+        if max_pages:
+            last_page = min(last_page, max_pages)
 
+        prefix, suffix = next_url[: match.start(1)], next_url[match.end(1) :]
+        return [f"{prefix}{page}{suffix}" for page in range(2, last_page + 1)]
+
+    async def _fetch_pages(
+        self, urls: List[str], pool: Executor, concurrency: int, delay: float
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Download several pages concurrently and extract their beers in a pool.
+
+        Args:
+            urls: URLs to fetch.
+            pool: Executor that runs parse_page on each downloaded page.
+            concurrency: Maximum number of requests in flight.
+            delay: Minimum seconds between request starts, retries included.
+
+        Returns:
+            Each page's beers (not deduplicated) in the same order as urls,
+            None for pages that still failed after retries.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        pacer = RequestPacer(delay)
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        timeout = aiohttp.ClientTimeout(total=30)
+        headers = {"User-Agent": self.session.headers["User-Agent"]}
+        loop = asyncio.get_running_loop()
+
+        async with aiohttp.ClientSession(
+            headers=headers, connector=connector, timeout=timeout
+        ) as session:
+
+            async def fetch(url: str) -> Optional[List[Dict[str, Any]]]:
+                async with semaphore:
+                    logger.info(f"Fetching page: {url}")
+                    try:
+                        content = await read_with_retry(
+                            session,
+                            url,
+                            RETRY_TOTAL,
+                            RETRY_BACKOFF,
+                            RETRY_STATUSES,
+                            pacer=pacer,
+                        )
+                        return await loop.run_in_executor(
+                            pool, parse_page, content, self.keep_raw_text
+                        )
+                    except (aiohttp.ClientError, asyncio.TimeoutError, etree.ParserError) as e:
+                        logger.error(f"Failed to fetch page {url}: {e}")
+                        return None
+
+            return await asyncio.gather(*(fetch(url) for url in urls))
+
+    def _iter_pages(
+        self, max_pages: Optional[int], delay: float, concurrency: int
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        Yield the listing pages in order, fetching them concurrently when possible.
+
+        Once the first page shows the total page count and a numbered
+        'Next page' link, every remaining page is fetched at once. Otherwise
+        the 'Next page' links are followed one at a time.
+
+        Args:
+            max_pages: Maximum number of pages to scrape. Scrapes all if None.
+            delay: Minimum seconds between the starts of page requests.
+            concurrency: Maximum number of requests in flight.
+
+        Yields:
+            Tuples of (page number, the page's beers before deduplication).
+        """
+        logger.info("--- Scraping Page 1 ---")
+        last_request = time.monotonic()
+        tree = self.fetch_page(self.base_url)
+        if tree is None:
+            return
+        yield 1, self._page_beers(tree, self.keep_raw_text)
+
+        pagination = self.get_pagination_info(tree)
+        page_urls = self._remaining_page_urls(pagination, max_pages)
+        if page_urls is not None:
+            if not page_urls:
+                logger.info(f"Reached max page limit of {max_pages}.")
+                return
+            logger.info(f"Fetching {len(page_urls)} remaining pages concurrently")
+            time.sleep(max(0.0, delay - (time.monotonic() - last_request)))
+            # Cell text joining and the beer regexes hold the GIL, so pages are
+            # parsed in worker processes while the event loop keeps downloading.
+            # They are spawned, not forked, so no worker inherits the event
+            # loop's threads or the log sinks, and the pool exists before
+            # asyncio.run starts any threads
+            workers = min(len(page_urls), os.cpu_count() or 1)
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                pages = asyncio.run(
+                    self._fetch_pages(page_urls, pool, concurrency, delay)
+                )
+            missing_pages = []
+            for page_number, page_beers in enumerate(pages, start=2):
+                if page_beers is None:
+                    missing_pages.append(page_number)
+                else:
+                    yield page_number, page_beers
+            if missing_pages:
+                logger.error(
+                    f"{len(missing_pages)} pages failed after retries and are missing "
+                    f"from the output: {missing_pages}"
+                )
+            return
+
+        # No page template to fill in: follow the 'Next page' links instead
+        page_count = 1
+        current_url = pagination["next_url"]
         while current_url:
-            page_count += 1
-            if max_pages and page_count > max_pages:
+            if max_pages and page_count >= max_pages:
                 logger.info(f"Reached max page limit of {max_pages}.")
                 break
+            # Pace request starts, so time spent downloading and parsing
+            # the previous page counts towards the delay
+            time.sleep(max(0.0, delay - (time.monotonic() - last_request)))
 
+            page_count += 1
             logger.info(f"--- Scraping Page {page_count} ---")
-            soup = self.fetch_page(current_url)
-            if not soup:
+            last_request = time.monotonic()
+            tree = self.fetch_page(current_url)
+            if tree is None:
                 break
+            yield page_count, self._page_beers(tree, self.keep_raw_text)
 
-            page_beers = self.extract_beers_from_page(soup)
+            current_url = self.get_pagination_info(tree)["next_url"]
+
+    def iter_all_pages(
+        self, max_pages: Optional[int] = None, delay: float = 1.0, concurrency: int = 10
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield unique beers from multiple pages of the beer listing as they are parsed.
+
+        Args:
+            max_pages: Maximum number of pages to scrape. Scrapes all if None.
+            delay: Minimum seconds between the starts of page requests.
+            concurrency: Maximum number of page requests in flight.
+
+        Yields:
+            Beer dictionaries, each not seen on an earlier page.
+        """
+        seen_beers: set[tuple[str, str]] = set()
+        beer_total = 0
+        page_total = 0
+
+        # Pages arrive in order, so IDs and dedup match a sequential crawl
+        for page_count, page_beers in self._iter_pages(max_pages, delay, concurrency):
+            page_total += 1
+            # Deduplicated against every earlier page, in page order
+            page_beers = _dedupe_beers(page_beers, seen_beers)
 
-            # Add new, unique beers to the master list
-            new_beers_found = 0
             for beer in page_beers:
-                beer_key = (beer["beer_name"].lower(), beer["brewery"].lower())
-                if beer_key not in seen_beers:
-                    seen_beers.add(beer_key)
-                    beer["beer_id"] = len(all_beers) + 1  # Assign a unique ID
-                    beer["source_page"] = page_count
-                    all_beers.append(beer)
-                    new_beers_found += 1
+                beer_total += 1
+                beer["beer_id"] = beer_total  # Assign a unique ID
+                beer["source_page"] = page_count
+                yield beer
 
             logger.info(
-                f"Added {new_beers_found} new unique beers. Total unique: {len(all_beers)}"
+                f"Added {len(page_beers)} new unique beers. Total unique: {beer_total}"
             )
 
-            pagination = self.get_pagination_info(soup)
-            current_url = pagination["next_url"]
-
-            if current_url and (not max_pages or page_count < max_pages):
-                time.sleep(delay)
-
         logger.success(
-            f"Scraping complete. Found {len(all_beers)} total unique beers from {page_count} pages."
+            f"Scraping complete. Found {beer_total} total unique beers from {page_total} pages."
         )
-        return all_beers
 
-    def save_to_csv(self, beers: List[Dict[str, Any]], filename: str) -> None:
+    def scrape_all_pages(
+        self, max_pages: Optional[int] = None, delay: float = 1.0, concurrency: int = 10
+    ) -> List[Dict[str, Any]]:
         """
-        Save beer data to a CSV file.
+        Scrape multiple pages of the beer listing.
 
         Args:
-            beers: The list of beer dictionaries to save.
-            filename: The name of the output CSV file.
+            max_pages: Maximum number of pages to scrape. Scrapes all if None.
+            delay: Minimum seconds between the starts of page requests.
+            concurrency: Maximum number of page requests in flight.
+
+        Returns:
+            A list of all unique beer data found across all pages.
         """
-        if not beers:
+        return list(self.iter_all_pages(max_pages, delay, concurrency))
+
+    def save_to_csv(self, beers: Iterable[Dict[str, Any]], filename: str) -> int:
+        """
+        Save beer data to a CSV file, writing rows as they arrive.
+
+        Args:
+            beers: The beer dictionaries to save, e.g. a list or iter_all_pages().
+            filename: The name of the output CSV file. A ".gz" suffix writes
+                it gzip-compressed.
+
+        Returns:
+            The number of beers written.
+        """
+        beers = iter(beers)
+        first = next(beers, None)
+        if first is None:
             logger.warning("No beer data provided to save.")
-            return
+            return 0
 
         filepath = self.data_dir / filename
-        df = pd.DataFrame(beers)
-
-        # Define a logical column order
-        column_order = [
-            "beer_id",
-            "beer_name",
-            "brewery",
-            "production_status",
-            "notes",
-            "source_page",
-            "raw_text",
-        ]
-        # Get list of columns that are actually in the DataFrame
-        final_columns = [col for col in column_order if col in df.columns]
 
-        df = df[final_columns]
-        df.to_csv(filepath, index=False)
-        logger.success(f"Successfully saved {len(df)} beers to {filepath}")
+        # Keep only the columns the beers actually have, e.g. raw_text is opt-in
+        final_columns = [col for col in COLUMN_ORDER if col in first]
 
+        # Rows are streamed straight from the dicts, no intermediate DataFrame
+        count = 0
+        if filepath.suffix == ".gz":
+            # Brewery and beer names repeat heavily, so the CSV compresses well
+            f = gzip.open(filepath, "wt", newline="", encoding="utf-8", compresslevel=GZIP_LEVEL)
+        else:
+            f = open(filepath, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
+        with f:
+            writer = csv.DictWriter(f, fieldnames=final_columns, extrasaction="ignore")
+            writer.writeheader()
+            for count, beer in enumerate(chain([first], beers), 1):
+                writer.writerow(beer)
+        logger.success(f"Successfully saved {count} beers to {filepath}")
+        return count
 
-# Add a global flag to prevent multiple executions
-_main_executed = False
 
 def main() -> None:
     """Main function to run the Belgian beer scraper."""
-    global _main_executed
-    if _main_executed:
-        return
-    _main_executed = True
-    
     # Configure logging
     log_file = Path(__file__).parent.parent.parent / "logs" / "belgenbier_scraper.log"
     logger.add(log_file, rotation="1 MB", retention="10 days", level="DEBUG")
@@ -348,29 +702,40 @@ def main() -> None:
     try:
         scraper = BelgenBierScraper()
 
+        brewery_counts: Counter = Counter()
+        status_counts: Counter = Counter()
+
+        def tally(beers: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            """Count breweries and statuses for the summary while beers stream past."""
+            for beer in beers:
+                brewery_counts[beer["brewery"]] += 1
+                status_counts[beer["production_status"]] += 1
+                yield beer
+
         # To scrape a small sample (e.g., first 3 pages)
-        all_beers = scraper.scrape_all_pages(max_pages=3)
+        beers = scraper.iter_all_pages(max_pages=3)
 
         # To scrape the entire website
-        # all_beers = scraper.scrape_all_pages()
+        # beers = scraper.iter_all_pages()
 
-        if all_beers:
-            # Save all collected data to a single file
-            scraper.save_to_csv(all_beers, "belgian_beers_complete.csv")
+        # Each page's beers are written as soon as it is parsed
+        total_beers = scraper.save_to_csv(tally(beers), "belgian_beers_complete.csv.gz")
 
+        if total_beers:
             # --- Final Summary ---
             logger.info("\n--- FINAL SUMMARY ---")
-            df = pd.DataFrame(all_beers)
-            logger.info(f"Total unique beers collected: {len(df)}")
+            logger.info(f"Total unique beers collected: {total_beers}")
 
-            if "brewery" in df.columns:
-                logger.info(f"Total unique breweries found: {df['brewery'].nunique()}")
-                top_10_breweries = df["brewery"].value_counts().nlargest(10)
-                logger.info("Top 10 breweries by beer count:\n" + str(top_10_breweries))
+            logger.info(f"Total unique breweries found: {len(brewery_counts)}")
+            top_10_breweries = "\n".join(
+                f"{brewery}: {count}" for brewery, count in brewery_counts.most_common(10)
+            )
+            logger.info("Top 10 breweries by beer count:\n" + top_10_breweries)
 
-            if "production_status" in df.columns:
-                status_counts = df["production_status"].value_counts()
-                logger.info("Production status summary:\n" + str(status_counts))
+            status_summary = "\n".join(
+                f"{status}: {count}" for status, count in status_counts.most_common()
+            )
+            logger.info("Production status summary:\n" + status_summary)
 
         logger.success("--- Belgian beer scraping completed successfully! ---")
 
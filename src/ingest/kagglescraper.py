@@ -8,10 +8,48 @@ import pandas as pd
 import os
 import zipfile
 import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from loguru import logger
-import time
+
+# orjson parses bytes straight to Python objects several times faster; json.loads
+# accepts bytes too, so either reads the files the same way
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Datasets downloaded at once; kept low to stay clear of Kaggle's rate limits
+MAX_DOWNLOAD_WORKERS = 5
+# Threads extracting one archive; zlib releases the GIL while inflating
+MAX_UNZIP_WORKERS = os.cpu_count() or 1
+# CSV files sampled at once; pandas releases the GIL while parsing
+MAX_CSV_WORKERS = 8
+# Rows read from each CSV file for analysis, and the pyarrow read block size,
+# small so only a little more than the sample gets parsed
+CSV_SAMPLE_ROWS = 1000
+CSV_BLOCK_SIZE = 64 * 1024
+# Download attempts when Kaggle answers 429 Too Many Requests, backing off
+# 2**attempt seconds between them up to a cap
+MAX_DOWNLOAD_RETRIES = 5
+MAX_BACKOFF_SECONDS = 60
+# Each downloaded dataset's analysis, kept next to its files; bump the version
+# whenever the analysis layout changes
+ANALYSIS_CACHE_FILE = ".analysis_cache.json"
+ANALYSIS_CACHE_VERSION = 1
+
+# Keywords marking a dataset title or a CSV column as beer-related, each list
+# compiled into one case-insensitive pattern so a name is scanned once
+BEER_DATASET_KEYWORDS = ['beer', 'brewery', 'brewing', 'ale', 'ipa', 'stout', 'lager', 'hops']
+BEER_COLUMN_KEYWORDS = [
+    'beer', 'brewery', 'brew', 'alcohol', 'abv', 'ibu', 'rating', 'review',
+    'style', 'hops', 'malt', 'yeast', 'flavor', 'aroma', 'appearance'
+]
+BEER_DATASET_RE = re.compile('|'.join(map(re.escape, BEER_DATASET_KEYWORDS)), re.IGNORECASE)
+BEER_COLUMN_RE = re.compile('|'.join(map(re.escape, BEER_COLUMN_KEYWORDS)), re.IGNORECASE)
 
 
 class KaggleBeerScraper:
@@ -19,8 +57,9 @@ class KaggleBeerScraper:
 
     def __init__(self):
         # Set up directories relative to project root
-        # Get the project root (2 levels up from src/ingest/)
-        project_root = Path(__file__).parent.parent.parent
+        # Get the project root (2 levels up from src/ingest/), resolved once so
+        # every path below is already absolute
+        project_root = Path(__file__).resolve().parent.parent.parent
         self.data_dir = project_root / "data" / "raw" / "kaggle"
         self.log_dir = project_root / "logs"
         self.metadata_dir = self.data_dir / "metadata"
@@ -39,9 +78,9 @@ class KaggleBeerScraper:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Data directory: {self.data_dir.absolute()}")
-        logger.info(f"Log directory: {self.log_dir.absolute()}")
-        logger.info(f"Metadata directory: {self.metadata_dir.absolute()}")
+        logger.info(f"Data directory: {self.data_dir}")
+        logger.info(f"Log directory: {self.log_dir}")
+        logger.info(f"Metadata directory: {self.metadata_dir}")
 
     def _setup_logging(self) -> None:
         """Setup logging for Kaggle scraper."""
@@ -71,7 +110,11 @@ class KaggleBeerScraper:
         if search_terms is None:
             search_terms = ['beer', 'brewery', 'brewing', 'alcohol', 'craft beer']
         
-        all_datasets = []
+        # Keyed by ref, so each dataset is kept once, from the first term that found it
+        unique = {}
+        # Keyword check result per ref, so datasets rejected under one term are
+        # not scanned again when a later term returns them
+        beer_related = {}
         
         for term in search_terms:
             logger.info(f"Searching for datasets with term: '{term}'")
@@ -86,13 +129,15 @@ class KaggleBeerScraper:
                     logger.info(f"Found {len(datasets)} datasets for term '{term}'")
                     for dataset in datasets:
                         if dataset:
-                            # Check if dataset is actually beer-related
-                            title_lower = dataset.title.lower()
-                            subtitle_lower = getattr(dataset, 'subtitle', '').lower()
+                            if dataset.ref in unique:
+                                continue
                             
-                            beer_keywords = ['beer', 'brewery', 'brewing', 'ale', 'ipa', 'stout', 'lager', 'hops']
-                            is_beer_related = any(keyword in title_lower or keyword in subtitle_lower 
-                                                for keyword in beer_keywords)
+                            # Check if dataset is actually beer-related
+                            is_beer_related = beer_related.get(dataset.ref)
+                            if is_beer_related is None:
+                                is_beer_related = bool(BEER_DATASET_RE.search(dataset.title)
+                                                       or BEER_DATASET_RE.search(getattr(dataset, 'subtitle', '')))
+                                beer_related[dataset.ref] = is_beer_related
                             
                             if is_beer_related or term == 'beer':  # Include all if searching specifically for beer
                                 dataset_info = {
@@ -108,9 +153,9 @@ class KaggleBeerScraper:
                                     'search_term': term,
                                     'is_beer_related': is_beer_related
                                 }
-                                all_datasets.append(dataset_info)
+                                unique[dataset.ref] = dataset_info
                             else:
-                                logger.debug(f"Skipping non-beer dataset: {dataset.title}")
+                                logger.debug("Skipping non-beer dataset: {}", dataset.title)
                 else:
                     logger.warning(f"No datasets found for term '{term}'")
                     
@@ -118,16 +163,8 @@ class KaggleBeerScraper:
                 logger.error(f"Error searching for term '{term}': {e}")
                 continue
                 
-        # Remove duplicates based on ref
-        unique_datasets = []
-        seen_refs = set()
-        for dataset in all_datasets:
-            if dataset['ref'] not in seen_refs:
-                unique_datasets.append(dataset)
-                seen_refs.add(dataset['ref'])
-                
         # Sort by relevance (beer-related first, then by download count)
-        unique_datasets.sort(key=lambda x: (not x['is_beer_related'], -x['download_count']))
+        unique_datasets = sorted(unique.values(), key=lambda x: (not x['is_beer_related'], -x['download_count']))
                 
         logger.success(f"Found {len(unique_datasets)} unique beer-related datasets")
         return unique_datasets
@@ -146,37 +183,43 @@ class KaggleBeerScraper:
         try:
             logger.info(f"Starting download of dataset: {dataset_ref}")
             
-            # First, download and analyze metadata
-            metadata_analysis = self.analyze_dataset_metadata(dataset_ref)
-            
             # Create dataset-specific directory
             dataset_dir = self.data_dir / dataset_ref.replace('/', '_')
             dataset_dir.mkdir(parents=True, exist_ok=True)
             
-            # Check if already downloaded
-            if not force_download and any(dataset_dir.iterdir()):
+            # Check if already downloaded, listing the directory only once
+            entries = self._scan_dir(dataset_dir)
+            if not force_download and entries:
                 logger.info(f"Dataset {dataset_ref} already exists. Skipping download.")
-                existing_files = list(dataset_dir.glob('*.csv'))
-                if existing_files:
-                    analysis = self._analyze_downloaded_files(dataset_dir, dataset_ref)
+                csv_stamp = self._csv_stamp(entries)
+                if csv_stamp:
+                    # Unchanged since the last run, so its analysis still holds
+                    cached = self._load_analysis_cache(dataset_dir, csv_stamp)
+                    if cached is not None:
+                        logger.info(f"Using cached analysis for dataset: {dataset_ref}")
+                        return cached
+                    
+                    analysis = self._analyze_downloaded_files(dataset_dir, dataset_ref, entries)
                     # Add metadata to analysis
-                    analysis['metadata'] = metadata_analysis
+                    analysis['metadata'] = self.analyze_dataset_metadata(dataset_ref)
+                    self._save_analysis_cache(dataset_dir, csv_stamp, analysis)
                     return analysis
             
+            # First, download and analyze metadata
+            metadata_analysis = self.analyze_dataset_metadata(dataset_ref, force_refresh=force_download)
+            
             # Download the dataset
             logger.info(f"Downloading files to: {dataset_dir}")
-            kaggle.api.dataset_download_files(
-                dataset_ref, 
-                path=str(dataset_dir), 
-                unzip=True
-            )
+            self._download_files_with_backoff(dataset_ref, dataset_dir)
             
             logger.success(f"Successfully downloaded dataset: {dataset_ref}")
             
             # Analyze downloaded files
-            analysis = self._analyze_downloaded_files(dataset_dir, dataset_ref)
+            entries = self._scan_dir(dataset_dir)
+            analysis = self._analyze_downloaded_files(dataset_dir, dataset_ref, entries)
             # Add metadata to analysis
             analysis['metadata'] = metadata_analysis
+            self._save_analysis_cache(dataset_dir, self._csv_stamp(entries), analysis)
             
             return analysis
             
@@ -189,30 +232,159 @@ class KaggleBeerScraper:
                 'metadata': {}
             }
 
-    def analyze_dataset_metadata(self, dataset_ref: str) -> Dict[str, Any]:
+    def _csv_stamp(self, entries: List[os.DirEntry]) -> Dict[str, int]:
+        """
+        Map each CSV file in a directory listing to its modification time.
+        
+        Args:
+            entries: The dataset directory's entries
+            
+        Returns:
+            Dictionary of CSV file names to mtimes in nanoseconds
+        """
+        return {
+            entry.name: entry.stat().st_mtime_ns
+            for entry in entries
+            if entry.is_file() and entry.name.lower().endswith('.csv')
+        }
+
+    def _load_analysis_cache(self, dataset_dir: Path, csv_stamp: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        Load a dataset's saved analysis if its CSV files have not changed since.
+        
+        Args:
+            dataset_dir: Directory containing downloaded files
+            csv_stamp: Current CSV modification times, from _csv_stamp
+            
+        Returns:
+            The saved analysis, or None if missing or stale
+        """
+        try:
+            cache = _json_loads((dataset_dir / ANALYSIS_CACHE_FILE).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if cache.get('cache_version') != ANALYSIS_CACHE_VERSION or cache.get('csv_stamp') != csv_stamp:
+            return None
+        return cache.get('analysis')
+
+    def _save_analysis_cache(self, dataset_dir: Path, csv_stamp: Dict[str, int], analysis: Dict[str, Any]) -> None:
+        """
+        Save a successful dataset analysis next to its files.
+        
+        Args:
+            dataset_dir: Directory containing downloaded files
+            csv_stamp: CSV modification times the analysis was made from
+            analysis: Analysis results
+        """
+        if not analysis.get('success') or not csv_stamp:
+            return
+        cache = {'cache_version': ANALYSIS_CACHE_VERSION, 'csv_stamp': csv_stamp, 'analysis': analysis}
+        try:
+            with open(dataset_dir / ANALYSIS_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save analysis cache for {dataset_dir.name}: {e}")
+
+    def _download_files_with_backoff(self, dataset_ref: str, dataset_dir: Path) -> None:
+        """
+        Download and unzip a dataset's files, backing off only when Kaggle rate limits us.
+        
+        Args:
+            dataset_ref: Kaggle dataset reference
+            dataset_dir: Directory to unzip the files into
+        """
+        for attempt in range(MAX_DOWNLOAD_RETRIES + 1):
+            try:
+                # Unzipped here rather than by the client, which extracts on one thread
+                kaggle.api.dataset_download_files(
+                    dataset_ref, 
+                    path=str(dataset_dir), 
+                    unzip=False
+                )
+                break
+            except Exception as e:
+                # Older clients raise ApiException(status=...), newer ones requests' HTTPError
+                status = getattr(e, 'status', None) or getattr(getattr(e, 'response', None), 'status_code', None)
+                if status != 429 or attempt == MAX_DOWNLOAD_RETRIES:
+                    raise
+                delay = min(2 ** attempt, MAX_BACKOFF_SECONDS)
+                logger.warning(f"Rate limited downloading {dataset_ref}, retrying in {delay}s")
+                time.sleep(delay)
+        
+        for entry in self._scan_dir(dataset_dir):
+            if entry.is_file() and entry.name.lower().endswith('.zip'):
+                self._extract_archive(Path(entry.path), dataset_dir)
+                os.remove(entry.path)
+
+    def _extract_archive(self, zip_path: Path, target_dir: Path) -> None:
+        """
+        Extract a zip archive with its members split across threads.
+        
+        Each thread opens its own ZipFile, so no file handle is shared.
+        Directories are created before the threads start.
+        
+        Args:
+            zip_path: Path to the zip archive
+            target_dir: Directory to extract into
+        """
+        with zipfile.ZipFile(zip_path) as zf:
+            # Largest first, dealt round-robin so the threads get similar amounts of work
+            members = sorted(zf.infolist(), key=lambda info: info.file_size, reverse=True)
+            if len(members) <= 1 or MAX_UNZIP_WORKERS == 1:
+                zf.extractall(target_dir)
+                return
+        
+        # zipfile creates missing directories without exist_ok, so two threads
+        # can race on a shared parent; create all of them here first
+        files = []
+        for info in members:
+            # Same path cleanup zipfile applies to member names
+            parts = [part for part in info.filename.split("/") if part not in ("", ".", "..")]
+            if not info.is_dir():
+                files.append(info)
+                parts = parts[:-1]
+            if parts:
+                target_dir.joinpath(*parts).mkdir(parents=True, exist_ok=True)
+        if not files:
+            return
+        
+        workers = min(MAX_UNZIP_WORKERS, len(files))
+        
+        def extract(chunk: List[zipfile.ZipInfo]) -> None:
+            with zipfile.ZipFile(zip_path) as zf:
+                for info in chunk:
+                    zf.extract(info, target_dir)
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() so an error in any thread is raised here
+            list(pool.map(extract, [files[i::workers] for i in range(workers)]))
+
+    def analyze_dataset_metadata(self, dataset_ref: str, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Download and analyze metadata for a specific dataset.
         
         Args:
             dataset_ref: Kaggle dataset reference (e.g., 'user/dataset-name')
+            force_refresh: Whether to download the metadata again if it is already saved
             
         Returns:
             Dictionary with metadata analysis
         """
         try:
-            logger.info(f"Downloading metadata for dataset: {dataset_ref}")
-            
-            # Download metadata
             metadata_path = self.metadata_dir / dataset_ref.replace('/', '_')
-            metadata_path.mkdir(parents=True, exist_ok=True)
+            metadata_file = metadata_path / "dataset-metadata.json"
             
-            kaggle.api.dataset_metadata(dataset_ref, path=str(metadata_path))
+            # Download metadata, unless an earlier run already saved it
+            if force_refresh or not metadata_file.exists():
+                logger.info(f"Downloading metadata for dataset: {dataset_ref}")
+                metadata_path.mkdir(parents=True, exist_ok=True)
+                kaggle.api.dataset_metadata(dataset_ref, path=str(metadata_path))
+            else:
+                logger.info(f"Using saved metadata for dataset: {dataset_ref}")
             
             # Read and parse metadata
-            metadata_file = metadata_path / "dataset-metadata.json"
             if metadata_file.exists():
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                metadata = _json_loads(metadata_file.read_bytes())
                     
                 analysis = {
                     'dataset_ref': dataset_ref,
@@ -249,13 +421,30 @@ class KaggleBeerScraper:
             logger.error(f"Error analyzing metadata for {dataset_ref}: {e}")
             return {'dataset_ref': dataset_ref, 'metadata_saved': False, 'error': str(e)}
 
-    def _analyze_downloaded_files(self, dataset_dir: Path, dataset_ref: str) -> Dict[str, Any]:
+    def _scan_dir(self, directory: Path) -> List[os.DirEntry]:
+        """
+        List a directory in one pass.
+        
+        The DirEntry objects cache their file type and, once fetched, their stat.
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            The directory entries
+        """
+        with os.scandir(directory) as it:
+            return list(it)
+
+    def _analyze_downloaded_files(self, dataset_dir: Path, dataset_ref: str,
+                                  entries: Optional[List[os.DirEntry]] = None) -> Dict[str, Any]:
         """
         Analyze downloaded files for quality and structure.
         
         Args:
             dataset_dir: Directory containing downloaded files
             dataset_ref: Dataset reference
+            entries: The directory's entries if already listed, scanned here otherwise
             
         Returns:
             Analysis results
@@ -271,25 +460,37 @@ class KaggleBeerScraper:
         }
         
         try:
+            if entries is None:
+                entries = self._scan_dir(dataset_dir)
+            file_entries = [entry for entry in entries if entry.is_file() and entry.name != ANALYSIS_CACHE_FILE]
+            
+            # Sample the CSV files in parallel, the other files only need a stat()
+            csv_entries = [entry for entry in file_entries if entry.name.lower().endswith('.csv')]
+            csv_analyses = {}
+            if csv_entries:
+                with ThreadPoolExecutor(max_workers=min(MAX_CSV_WORKERS, len(csv_entries))) as pool:
+                    results = pool.map(self._analyze_csv_file,
+                                       [Path(entry.path) for entry in csv_entries])
+                    csv_analyses = dict(zip((entry.path for entry in csv_entries), results))
+            
             # Analyze all files in the directory
-            for file_path in dataset_dir.iterdir():
-                if file_path.is_file():
-                    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-                    analysis['total_size_mb'] += file_size_mb
-                    
-                    file_info = {
-                        'name': file_path.name,
-                        'size_mb': round(file_size_mb, 2),
-                        'extension': file_path.suffix.lower()
-                    }
+            for entry in file_entries:
+                file_size_mb = entry.stat().st_size / (1024 * 1024)
+                analysis['total_size_mb'] += file_size_mb
+                
+                extension = os.path.splitext(entry.name)[1].lower()
+                file_info = {
+                    'name': entry.name,
+                    'size_mb': round(file_size_mb, 2),
+                    'extension': extension
+                }
+                
+                # Analyze CSV files specifically
+                if extension == '.csv':
+                    analysis['csv_files'] += 1
+                    file_info.update(csv_analyses[entry.path])
                     
-                    # Analyze CSV files specifically
-                    if file_path.suffix.lower() == '.csv':
-                        analysis['csv_files'] += 1
-                        csv_analysis = self._analyze_csv_file(file_path)
-                        file_info.update(csv_analysis)
-                        
-                    analysis['files'].append(file_info)
+                analysis['files'].append(file_info)
             
             # Overall data quality assessment
             analysis['data_quality'] = self._assess_data_quality(analysis)
@@ -317,28 +518,13 @@ class KaggleBeerScraper:
         """
         try:
             # Read CSV with error handling
-            df = pd.read_csv(file_path, nrows=1000)  # Sample first 1000 rows for analysis
-            
-            analysis = {
-                'rows_sampled': len(df),
-                'columns': len(df.columns),
-                'column_names': list(df.columns),
-                'data_types': df.dtypes.to_dict(),
-                'missing_values': df.isnull().sum().to_dict(),
-                'beer_related_columns': [],
-                'quality_score': 0
-            }
+            analysis = self._sample_csv(file_path)
             
             # Check for beer-related columns
-            beer_keywords = [
-                'beer', 'brewery', 'brew', 'alcohol', 'abv', 'ibu', 'rating', 'review',
-                'style', 'hops', 'malt', 'yeast', 'flavor', 'aroma', 'appearance'
+            analysis['beer_related_columns'] = [
+                col for col in analysis['column_names'] if BEER_COLUMN_RE.search(col)
             ]
-            
-            for col in df.columns:
-                col_lower = col.lower()
-                if any(keyword in col_lower for keyword in beer_keywords):
-                    analysis['beer_related_columns'].append(col)
+            analysis['quality_score'] = 0
             
             # Calculate quality score
             quality_score = 0
@@ -348,9 +534,9 @@ class KaggleBeerScraper:
             
             analysis['quality_score'] = quality_score
             
-            logger.debug(f"CSV analysis complete for {file_path.name}: "
-                        f"{analysis['columns']} cols, {analysis['rows_sampled']} rows, "
-                        f"quality: {quality_score}")
+            # Formatted by loguru only if a sink takes DEBUG messages
+            logger.debug("CSV analysis complete for {}: {} cols, {} rows, quality: {}",
+                         file_path.name, analysis['columns'], analysis['rows_sampled'], quality_score)
             
             return analysis
             
@@ -361,6 +547,66 @@ class KaggleBeerScraper:
                 'quality_score': 0
             }
 
+    def _sample_csv(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Read the first rows of a CSV file and describe their columns.
+        
+        Uses pyarrow's streaming reader, which parses straight into columnar
+        batches and reports null counts without building Python objects.
+        Falls back to pandas if pyarrow is missing or cannot read the file.
+        
+        Args:
+            file_path: Path to CSV file
+            
+        Returns:
+            Rows sampled, column count, names, types and missing values
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            reader = pa_csv.open_csv(
+                file_path,
+                # Files are already sampled in parallel, so one thread per file
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=False),
+                # Count empty strings as missing, as pandas does
+                convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+            )
+            batches = []
+            rows = 0
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= CSV_SAMPLE_ROWS:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, CSV_SAMPLE_ROWS)
+            
+            return {
+                'rows_sampled': table.num_rows,
+                'columns': table.num_columns,
+                'column_names': table.column_names,
+                'data_types': {field.name: str(field.type) for field in table.schema},
+                'missing_values': {name: column.null_count for name, column in zip(table.column_names, table.columns)}
+            }
+            
+        except Exception as e:
+            logger.debug(f"pyarrow could not sample {file_path.name}, using pandas: {e}")
+            
+        # Keep the columns Arrow-backed so isnull() runs as one kernel per column;
+        # the pyarrow engine would be faster still but does not support nrows
+        try:
+            df = pd.read_csv(file_path, nrows=CSV_SAMPLE_ROWS, dtype_backend='pyarrow')
+        except ImportError:
+            df = pd.read_csv(file_path, nrows=CSV_SAMPLE_ROWS)
+        return {
+            'rows_sampled': len(df),
+            'columns': len(df.columns),
+            'column_names': list(df.columns),
+            # Plain strings and ints, as from pyarrow, so the result can be cached as JSON
+            'data_types': {name: str(dtype) for name, dtype in df.dtypes.items()},
+            'missing_values': {name: int(count) for name, count in df.isnull().sum().items()}
+        }
+
     def _assess_data_quality(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """
         Assess overall data quality of the dataset.
@@ -442,46 +688,48 @@ class KaggleBeerScraper:
         
         logger.info(f"Starting download of {len(recommended_datasets)} recommended datasets")
         
-        for dataset_ref in recommended_datasets:
-            results['attempted'] += 1
-            logger.info(f"Processing dataset {results['attempted']}/{len(recommended_datasets)}: {dataset_ref}")
+        # Downloads are network bound, so run them side by side and collect the
+        # results in list order
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as pool:
+            futures = [pool.submit(self.download_dataset, dataset_ref) for dataset_ref in recommended_datasets]
             
-            try:
-                # Download and analyze
-                download_result = self.download_dataset(dataset_ref)
+            for dataset_ref, future in zip(recommended_datasets, futures):
+                results['attempted'] += 1
+                logger.info(f"Processing dataset {results['attempted']}/{len(recommended_datasets)}: {dataset_ref}")
+            
+                try:
+                    # Wait for the download and analysis
+                    download_result = future.result()
                 
-                if download_result.get('success', False):
-                    quality_score = download_result.get('data_quality', {}).get('overall_score', 0)
+                    if download_result.get('success', False):
+                        quality_score = download_result.get('data_quality', {}).get('overall_score', 0)
                     
-                    if quality_score >= min_quality_score:
-                        results['successful'] += 1
-                        download_result['recommended'] = True
-                        logger.success(f"Successfully downloaded high-quality dataset: {dataset_ref} "
-                                     f"(Quality: {quality_score})")
+                        if quality_score >= min_quality_score:
+                            results['successful'] += 1
+                            download_result['recommended'] = True
+                            logger.success(f"Successfully downloaded high-quality dataset: {dataset_ref} "
+                                         f"(Quality: {quality_score})")
+                        else:
+                            logger.warning(f"Dataset quality below threshold: {dataset_ref} "
+                                         f"(Quality: {quality_score} < {min_quality_score})")
+                            download_result['recommended'] = False
+                            # Still count as successful download, just low quality
+                            results['successful'] += 1
                     else:
-                        logger.warning(f"Dataset quality below threshold: {dataset_ref} "
-                                     f"(Quality: {quality_score} < {min_quality_score})")
-                        download_result['recommended'] = False
-                        # Still count as successful download, just low quality
-                        results['successful'] += 1
-                else:
-                    results['failed'] += 1
-                    logger.error(f"Failed to download dataset: {dataset_ref}")
+                        results['failed'] += 1
+                        logger.error(f"Failed to download dataset: {dataset_ref}")
                     
-                results['datasets'].append(download_result)
-                
-                # Brief pause between downloads
-                time.sleep(1)
+                    results['datasets'].append(download_result)
                 
-            except Exception as e:
-                results['failed'] += 1
-                logger.error(f"Error processing dataset {dataset_ref}: {e}")
-                results['datasets'].append({
-                    'dataset_ref': dataset_ref,
-                    'success': False,
-                    'error': str(e),
-                    'metadata': {}
-                })
+                except Exception as e:
+                    results['failed'] += 1
+                    logger.error(f"Error processing dataset {dataset_ref}: {e}")
+                    results['datasets'].append({
+                        'dataset_ref': dataset_ref,
+                        'success': False,
+                        'error': str(e),
+                        'metadata': {}
+                    })
         
         # Generate summary
         results['summary'] = self._generate_download_summary(results)
@@ -1,12 +1,21 @@
 import os
 import csv
+import functools
+import gzip
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from dotenv import load_dotenv
 from google.cloud import bigquery
 from google.cloud.exceptions import ClientError
 from loguru import logger
 
+if TYPE_CHECKING:
+    from google.cloud import storage
+
 # --- Configuration (remains the same) ---
 load_dotenv()
 logger.add("logs/bigquery_loader.log", rotation="10 MB", level="DEBUG")
@@ -16,12 +25,120 @@ logger.add(
     level="INFO",
 )
 
+# Upload chunk size for GCS staging and read buffer for direct uploads (8 MiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# Folder in the staging bucket that CSV files are uploaded to
+GCS_STAGING_PREFIX = "bigquery_staging"
+# CSV files uploaded at once; each upload is a separate network stream
+MAX_UPLOAD_WORKERS = 8
+# Read block size when reading CSVs with pyarrow (1 MiB)
+SCHEMA_BLOCK_SIZE = 1024 * 1024
+# Columns loaded as FLOAT64 when all of their values parse as numbers. Every
+# other column stays STRING, so identifiers such as postcode keep leading
+# zeros; the dbt staging models cast anything else they need
+NUMERIC_COLUMNS = frozenset({"abv_pct", "latitude", "longitude"})
+# Compression for the Parquet files CSVs are converted to before loading
+PARQUET_COMPRESSION = "zstd"
+# Staged CSVs are gzipped first; the fastest level already shrinks text several
+# times over and keeps compression from becoming the bottleneck
+STAGING_GZIP_LEVEL = 1
+
+
+@functools.lru_cache(maxsize=1)
+def get_bigquery_client(project_id: str) -> bigquery.Client:
+    """
+    Returns a BigQuery client for the project, created once and then reused.
+
+    Credential lookup and HTTP session setup happen only on the first call.
+
+    Args:
+        project_id: The Google Cloud project ID.
+
+    Returns:
+        The shared BigQuery client.
+    """
+    client = bigquery.Client(project=project_id)
+    logger.debug("BigQuery client initialized successfully.")
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def get_storage_client(project_id: str) -> "storage.Client":
+    """
+    Returns a GCS client for the project, created once and then reused.
+
+    Args:
+        project_id: The Google Cloud project ID.
+
+    Returns:
+        The shared storage client.
+    """
+    # Only needed when a staging bucket is configured
+    from google.cloud import storage
+
+    return storage.Client(project=project_id)
+
+
+def numeric_columns(file_path: Path, header: list[str]) -> set[str]:
+    """
+    Finds the allow-listed numeric columns of a CSV file whose values all
+    parse as numbers.
+
+    Only those columns are read, as text, and each one is then cast to float,
+    so a stray non-numeric value keeps just its own column a STRING.
+
+    Args:
+        file_path: The path to the CSV file.
+        header: The column names from the header row.
+
+    Returns:
+        The names of the columns that can be loaded as FLOAT64.
+    """
+    candidates = [name for name in header if name in NUMERIC_COLUMNS]
+    if not candidates:
+        return set()
+
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pa_csv
+
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(block_size=SCHEMA_BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=candidates,
+                column_types={name: pa.string() for name in candidates},
+                # Empty fields are NULL, as in a BigQuery CSV load
+                null_values=[""],
+                strings_can_be_null=True,
+            ),
+        )
+    except Exception as e:
+        logger.warning(
+            f"Could not read the numeric columns of {file_path.name}, using STRING: {e}"
+        )
+        return set()
+
+    numeric = set()
+    for name in candidates:
+        try:
+            pc.cast(table[name], pa.float64())
+        except pa.ArrowInvalid:
+            logger.warning(
+                f"Column {name} of {file_path.name} has non-numeric values, using STRING"
+            )
+        else:
+            numeric.add(name)
+    return numeric
+
 
 # --- NEW HELPER FUNCTION ---
 @logger.catch
 def get_schema_from_csv(file_path: Path) -> list[bigquery.SchemaField]:
     """
-    Reads the header row of a CSV file and creates a BigQuery schema.
+    Reads the header row of a CSV file and creates a BigQuery schema, with
+    allow-listed numeric columns typed FLOAT64 and the rest STRING.
 
     Args:
         file_path: The path to the CSV file.
@@ -31,18 +148,28 @@ def get_schema_from_csv(file_path: Path) -> list[bigquery.SchemaField]:
     """
     logger.info(f"Generating schema from header of {file_path.name}...")
     try:
-        with open(file_path, "r", encoding="utf-8") as csv_file:
-            reader = csv.reader(csv_file)
-            header = next(reader)
+        # The column names only need the header line
+        with open(file_path, "r", encoding="utf-8", newline="") as csv_file:
+            header_line = csv_file.readline()
+        header = next(csv.reader([header_line]), [])
 
         if not header:
             raise ValueError("CSV header is empty.")
 
-        # For simplicity and robustness, we'll default all columns to STRING type.
+        # All columns are STRING except the numeric ones in NUMERIC_COLUMNS.
         # BigQuery is good at handling data in string format.
-        schema = [bigquery.SchemaField(name, "STRING") for name in header]
+        numeric = numeric_columns(file_path, header)
+        column_types = [
+            "FLOAT64" if name in numeric else "STRING" for name in header
+        ]
+
+        schema = [
+            bigquery.SchemaField(name, column_type)
+            for name, column_type in zip(header, column_types)
+        ]
         logger.success(
-            f"Schema generated with {len(schema)} columns: {', '.join(header)}"
+            f"Schema generated with {len(schema)} columns: "
+            f"{', '.join(f'{name} {column_type}' for name, column_type in zip(header, column_types))}"
         )
         return schema
 
@@ -54,12 +181,176 @@ def get_schema_from_csv(file_path: Path) -> list[bigquery.SchemaField]:
         raise
 
 
+def convert_csv_to_parquet(
+    file_path: Path, schema: list[bigquery.SchemaField]
+) -> Path:
+    """
+    Writes a CSV file out as a compressed Parquet file, so BigQuery does not
+    have to parse text and fewer bytes are uploaded.
+
+    The CSV is streamed through in blocks, and its columns are read as the
+    types in the schema so the Parquet file matches it.
+
+    Args:
+        file_path: The path to the CSV file.
+        schema: The BigQuery schema from get_schema_from_csv.
+
+    Returns:
+        The path to a temporary Parquet file, for the caller to remove.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+
+    arrow_types = {"FLOAT64": pa.float64()}
+    reader = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(block_size=SCHEMA_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={
+                field.name: arrow_types.get(field.field_type, pa.string())
+                for field in schema
+            },
+            # Empty fields are NULL, as in a BigQuery CSV load
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
+        parquet_path = Path(tmp.name)
+    try:
+        with pa_parquet.ParquetWriter(
+            parquet_path, reader.schema, compression=PARQUET_COMPRESSION
+        ) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    except Exception:
+        os.remove(parquet_path)
+        raise
+
+    logger.debug(f"Converted {file_path.name} to Parquet at {parquet_path}")
+    return parquet_path
+
+
+def _upload_to_gcs(
+    project_id: str, bucket_name: str, blob_name: str, local_path: str, content_type: str
+) -> str:
+    """
+    Uploads a local file to a GCS bucket.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        bucket_name: The staging bucket name.
+        blob_name: The name of the object to create.
+        local_path: The path to the file to upload.
+        content_type: The object's content type.
+
+    Returns:
+        The gs:// URI of the uploaded file.
+    """
+    bucket = get_storage_client(project_id).bucket(bucket_name)
+    # Setting a chunk size makes this a resumable upload in 8 MiB pieces
+    blob = bucket.blob(blob_name, chunk_size=UPLOAD_CHUNK_SIZE)
+    blob.upload_from_filename(local_path, content_type=content_type)
+    return f"gs://{bucket_name}/{blob_name}"
+
+
+def stage_csv_to_gcs(project_id: str, bucket_name: str, file_path: Path) -> str:
+    """
+    Uploads a gzipped copy of a CSV file to a GCS bucket so BigQuery can load
+    it server-side. BigQuery reads gzipped CSV as is.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        bucket_name: The staging bucket name.
+        file_path: The path to the CSV file.
+
+    Returns:
+        The gs:// URI of the uploaded file.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".csv.gz", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        with open(file_path, "rb") as source_file, gzip.open(
+            tmp_path, "wb", compresslevel=STAGING_GZIP_LEVEL
+        ) as gz_file:
+            shutil.copyfileobj(source_file, gz_file, length=UPLOAD_CHUNK_SIZE)
+        # No gzip content encoding, so GCS serves the bytes to BigQuery unchanged
+        source_uri = _upload_to_gcs(
+            project_id,
+            bucket_name,
+            f"{GCS_STAGING_PREFIX}/{file_path.name}.gz",
+            tmp_path,
+            "application/gzip",
+        )
+    finally:
+        os.remove(tmp_path)
+
+    logger.info(f"Staged {file_path.name} at {source_uri}")
+    return source_uri
+
+
+def stage_parquet_to_gcs(
+    project_id: str, bucket_name: str, parquet_path: Path, file_path: Path
+) -> str:
+    """
+    Uploads a Parquet file converted from a CSV file to a GCS bucket so
+    BigQuery can load it server-side.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        bucket_name: The staging bucket name.
+        parquet_path: The path to the Parquet file.
+        file_path: The path to the CSV file it was converted from.
+
+    Returns:
+        The gs:// URI of the uploaded file.
+    """
+    source_uri = _upload_to_gcs(
+        project_id,
+        bucket_name,
+        f"{GCS_STAGING_PREFIX}/{file_path.stem}.parquet",
+        str(parquet_path),
+        "application/vnd.apache.parquet",
+    )
+    logger.info(f"Staged {file_path.name} as Parquet at {source_uri}")
+    return source_uri
+
+
+def _log_client_error(e: ClientError) -> None:
+    """
+    Logs a BigQuery client error together with its per-error reasons.
+
+    Args:
+        e: The client error raised by BigQuery.
+    """
+    logger.error(f"A client error occurred during the BigQuery load job: {e}")
+    if e.errors:
+        for error in e.errors:
+            logger.error(f"Reason: {error['reason']}, Message: {error['message']}")
+
+
 @logger.catch
-def load_csv_to_bigquery(
-    project_id: str, dataset_id: str, table_id: str, file_path: Path
-) -> None:
+def submit_load_csv_to_bigquery(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    file_path: Path,
+    client: Optional[bigquery.Client] = None,
+) -> bigquery.LoadJob:
     """
-    Loads a CSV file into a BigQuery table, using the CSV header for column names.
+    Starts loading a CSV file into a BigQuery table without waiting for it.
+
+    Args:
+        project_id: The Google Cloud project ID.
+        dataset_id: The BigQuery dataset ID.
+        table_id: The BigQuery table ID.
+        file_path: The path to the CSV file.
+        client: BigQuery client to use. Defaults to the shared client for project_id.
+
+    Returns:
+        The running load job.
     """
     logger.info(
         f"Initiating load for {file_path.name} to table {project_id}.{dataset_id}.{table_id}"
@@ -69,47 +360,109 @@ def load_csv_to_bigquery(
         # --- 1. Get the schema from the CSV header ---
         schema = get_schema_from_csv(file_path)
 
-        # --- 2. Initialize BigQuery Client ---
-        client = bigquery.Client(project=project_id)
-        logger.debug("BigQuery client initialized successfully.")
-
-        # --- 3. Configure the Load Job (UPDATED) ---
-        job_config = bigquery.LoadJobConfig(
-            schema=schema,
-            source_format=bigquery.SourceFormat.CSV,
-            skip_leading_rows=1,
-            autodetect=False,
-            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,  # Overwrite table if it exists
-        )
-        logger.debug("Load job configured with explicit schema from CSV header.")
+        # --- 2. Get the BigQuery Client ---
+        if client is None:
+            client = get_bigquery_client(project_id)
+
+        # --- 3. Convert to Parquet, loading the CSV itself if that fails ---
+        try:
+            parquet_path = convert_csv_to_parquet(file_path, schema)
+        except Exception as e:
+            logger.warning(
+                f"Could not convert {file_path.name} to Parquet, loading the CSV: {e}"
+            )
+            parquet_path = None
 
-        # --- 4. Upload File and Run Load Job ---
-        with open(file_path, "rb") as source_file:
-            load_job = client.load_table_from_file(
-                source_file,
-                f"{project_id}.{dataset_id}.{table_id}",
-                job_config=job_config,
+        # --- 4. Configure the Load Job (UPDATED) ---
+        if parquet_path is not None:
+            job_config = bigquery.LoadJobConfig(
+                schema=schema,
+                source_format=bigquery.SourceFormat.PARQUET,
+                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,  # Overwrite table if it exists
             )
-            logger.info(
-                f"Starting BigQuery load job {load_job.job_id} for {file_path.name}"
+        else:
+            job_config = bigquery.LoadJobConfig(
+                schema=schema,
+                source_format=bigquery.SourceFormat.CSV,
+                skip_leading_rows=1,
+                autodetect=False,
+                write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,  # Overwrite table if it exists
             )
+        logger.debug("Load job configured with explicit schema from CSV header.")
 
-        load_job.result()  # Waits for the job to complete.
-        logger.success(
-            f"Successfully loaded {file_path.name} to {project_id}.{dataset_id}.{table_id}"
+        # --- 5. Upload File and Start Load Job ---
+        table_ref = f"{project_id}.{dataset_id}.{table_id}"
+        staging_bucket = os.getenv("GCS_STAGING_BUCKET")
+        try:
+            if staging_bucket:
+                # Load from GCS so BigQuery reads the file itself
+                if parquet_path is not None:
+                    source_uri = stage_parquet_to_gcs(
+                        project_id, staging_bucket, parquet_path, file_path
+                    )
+                else:
+                    source_uri = stage_csv_to_gcs(project_id, staging_bucket, file_path)
+                load_job = client.load_table_from_uri(
+                    source_uri, table_ref, job_config=job_config
+                )
+            else:
+                upload_path = parquet_path if parquet_path is not None else file_path
+                with open(upload_path, "rb", buffering=UPLOAD_CHUNK_SIZE) as source_file:
+                    load_job = client.load_table_from_file(
+                        source_file, table_ref, job_config=job_config
+                    )
+        finally:
+            # The upload is done once the job exists
+            if parquet_path is not None:
+                os.remove(parquet_path)
+        logger.info(
+            f"Starting BigQuery load job {load_job.job_id} for {file_path.name}"
         )
+        return load_job
 
     except ClientError as e:
-        logger.error(f"A client error occurred during the BigQuery load job: {e}")
-        if e.errors:
-            for error in e.errors:
-                logger.error(f"Reason: {error['reason']}, Message: {error['message']}")
+        _log_client_error(e)
         raise
     except Exception as e:
         logger.error(f"An unexpected error occurred: {e}")
         raise
 
 
+def wait_for_load_job(load_job: bigquery.LoadJob, file_path: Path) -> None:
+    """
+    Waits for a load job started by submit_load_csv_to_bigquery to finish.
+
+    Args:
+        load_job: The running load job.
+        file_path: The path to the CSV file being loaded.
+    """
+    try:
+        load_job.result()  # Waits for the job to complete.
+        logger.success(f"Successfully loaded {file_path.name} to {load_job.destination}")
+
+    except ClientError as e:
+        _log_client_error(e)
+        raise
+
+
+@logger.catch
+def load_csv_to_bigquery(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    file_path: Path,
+    client: Optional[bigquery.Client] = None,
+) -> None:
+    """
+    Loads a CSV file into a BigQuery table, using the CSV header for column names.
+    """
+    load_job = submit_load_csv_to_bigquery(
+        project_id, dataset_id, table_id, file_path, client=client
+    )
+    if load_job is not None:
+        wait_for_load_job(load_job, file_path)
+
+
 def main():
     """
     Main function to find CSV files and load them into BigQuery.
@@ -137,18 +490,37 @@ def main():
 
     logger.info(f"Found {len(csv_files)} CSV files to process.")
 
-    for csv_file in csv_files:
-        table_id = csv_file.stem
+    # Start every load first, uploading the files in parallel; the jobs run
+    # server-side, so waiting on them afterwards takes as long as the slowest
+    # one rather than the sum
+    client = get_bigquery_client(project_id)
+
+    def submit(csv_file: Path) -> Optional[bigquery.LoadJob]:
+        return submit_load_csv_to_bigquery(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            table_id=csv_file.stem,
+            file_path=csv_file,
+            client=client,
+        )
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_UPLOAD_WORKERS, len(csv_files))
+    ) as pool:
+        submitted = list(zip(csv_files, pool.map(submit, csv_files)))
+
+    load_jobs = []
+    for csv_file, load_job in submitted:
+        if load_job is None:
+            logger.error(f"Failed to process {csv_file.name}. Moving to the next file.")
+            continue
+        load_jobs.append((csv_file, load_job))
+
+    for csv_file, load_job in load_jobs:
         try:
-            load_csv_to_bigquery(
-                project_id=project_id,
-                dataset_id=dataset_id,
-                table_id=table_id,
-                file_path=csv_file,
-            )
+            wait_for_load_job(load_job, csv_file)
         except Exception as e:
             logger.error(f"Failed to process {csv_file.name}. Moving to the next file.")
-            pass
 
     logger.info("BigQuery data loading process finished.")
 
@@ -1,11 +1,19 @@
+import asyncio
+import json
+import sqlite3
 import time
 from pathlib import Path
+from typing import Iterable, List, Optional
 
+import aiohttp
 import pandas as pd
-from geopy.geocoders import Nominatim
-from geopy.location import Location
+import pyarrow as pa
+import pyarrow.parquet as pa_parquet
 from loguru import logger
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+
+from src.util.async_http import RequestPacer
+from src.util.data_files import fresh_parquet_copy
 
 # --- Configuration ---
 logger.add("logs/geodata_catcher.log", rotation="10 MB", level="DEBUG")
@@ -19,26 +27,92 @@ INPUT_FILE = Path("data/clean/wiki_be_breweries.csv")
 OUTPUT_FILE = Path(
     "data/clean/wiki_be_brewery_addresses.csv"
 )
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+USER_AGENT = "belgian_brewery_mapper_v2"
+# Nominatim's usage policy allows at most one request per second
+REQUEST_INTERVAL = 1.0
+# Nominatim answers from earlier runs, keyed by normalized query
+CACHE_FILE = Path("data/cache/nominatim.sqlite")
+# Seconds a "not found" answer is trusted before Nominatim is asked again (7 days)
+NOT_FOUND_TTL = 7 * 24 * 60 * 60
+# Compression for the Parquet copy written next to the output CSV
+PARQUET_COMPRESSION = "zstd"
+# Seconds between progress bar redraws; cache hits finish thousands a second
+PROGRESS_MININTERVAL = 0.5
+
+
+def open_geocode_cache(cache_file: Path = CACHE_FILE) -> sqlite3.Connection:
+    """
+    Opens the on-disk geocoding cache, creating it if needed.
+
+    Args:
+        cache_file: Path to the SQLite cache file.
+
+    Returns:
+        An open connection to the cache.
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(cache_file)
+    cache.execute(
+        "CREATE TABLE IF NOT EXISTS geocode "
+        "(query TEXT PRIMARY KEY, raw_json TEXT, ts INTEGER)"
+    )
+    return cache
 
 
 @logger.catch
-def get_brewery_location(geolocator: Nominatim, brewery_name: str) -> Location | None:
+async def get_brewery_location(
+    session: aiohttp.ClientSession,
+    pacer: RequestPacer,
+    brewery_name: str,
+    cache: Optional[sqlite3.Connection] = None,
+) -> Optional[dict]:
     """
-    Geocodes a brewery name to get its full location object.
+    Geocodes a brewery name to get its raw Nominatim result.
+
+    Answers found in the cache are returned without querying Nominatim.
+    "Not found" answers are only reused for NOT_FOUND_TTL seconds.
 
     Args:
-        geolocator: An instance of a geopy geolocator.
+        session: The HTTP session to query Nominatim with.
+        pacer: Shared pacer keeping requests within Nominatim's usage policy.
         brewery_name: The name of the brewery to find.
+        cache: Connection from open_geocode_cache, if results should be cached.
 
     Returns:
-        The full geopy Location object, or None if not found.
+        The raw Nominatim result with address details, or None if not found.
     """
     try:
         query = f"{brewery_name}, Belgium"
-        location = geolocator.geocode(query, addressdetails=True)
-        location = location if isinstance(location, Location) or location is None else None
+        key = query.strip().lower()
+
+        row = None
+        if cache is not None:
+            row = cache.execute(
+                "SELECT raw_json, ts FROM geocode WHERE query = ?", (key,)
+            ).fetchone()
+            # Retry misses once they are old enough, e.g. after a Nominatim gap
+            if row is not None and row[0] is None and time.time() - row[1] > NOT_FOUND_TTL:
+                row = None
 
-        time.sleep(1)  # Respect Nominatim's usage policy
+        if row is not None:
+            # A stored NULL means Nominatim found nothing last time
+            location = json.loads(row[0]) if row[0] is not None else None
+            logger.debug(f"Using cached location for '{brewery_name}'")
+        else:
+            await pacer.wait()  # Respect Nominatim's usage policy
+            params = {"q": query, "format": "json", "addressdetails": 1, "limit": 1}
+            async with session.get(NOMINATIM_URL, params=params) as response:
+                response.raise_for_status()
+                results = await response.json()
+            location = results[0] if results else None
+
+            if cache is not None:
+                cache.execute(
+                    "INSERT OR REPLACE INTO geocode VALUES (?, ?, ?)",
+                    (key, json.dumps(location) if location else None, int(time.time())),
+                )
+                cache.commit()
 
         if location:
             logger.debug(f"Found location for '{brewery_name}'")
@@ -51,13 +125,36 @@ def get_brewery_location(geolocator: Nominatim, brewery_name: str) -> Location |
         return None
 
 
-def parse_location_data(brewery_name: str, location: Location | None) -> dict:
+async def geocode_breweries(
+    brewery_names: Iterable[str], cache: Optional[sqlite3.Connection] = None
+) -> List[Optional[dict]]:
+    """
+    Geocodes breweries concurrently, with request starts paced to one a second.
+
+    Args:
+        brewery_names: The names of the breweries to find.
+        cache: Connection from open_geocode_cache, if results should be cached.
+
+    Returns:
+        The raw Nominatim result for each brewery, in order, or None if not found.
+    """
+    pacer = RequestPacer(REQUEST_INTERVAL)
+    async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session:
+        return await tqdm_asyncio.gather(
+            *(get_brewery_location(session, pacer, name, cache) for name in brewery_names),
+            desc="Geocoding Breweries",
+            mininterval=PROGRESS_MININTERVAL,
+            smoothing=0.05,
+        )
+
+
+def parse_location_data(brewery_name: str, location: Optional[dict]) -> dict:
     """
-    Parses a geopy Location object to extract structured address components.
+    Parses a raw Nominatim result to extract structured address components.
 
     Args:
         brewery_name: The name of the brewery (for context).
-        location: The geopy Location object.
+        location: The raw Nominatim result.
 
     Returns:
         A dictionary containing structured address information.
@@ -75,20 +172,20 @@ def parse_location_data(brewery_name: str, location: Location | None) -> dict:
         "longitude": None,
     }
 
-    if not location or not location.raw or "address" not in location.raw:
+    if not location or "address" not in location:
         logger.warning(f"No detailed address data found for {brewery_name}")
         return parsed_data
 
     # Safely update the dictionary with available data
     parsed_data.update(
         {
-            "full_address": location.address,
-            "latitude": location.latitude,
-            "longitude": location.longitude,
+            "full_address": location.get("display_name"),
+            "latitude": float(location["lat"]),
+            "longitude": float(location["lon"]),
         }
     )
 
-    address_parts = location.raw["address"]
+    address_parts = location["address"]
 
     # Extract components using .get() to gracefully handle missing keys
     parsed_data.update(
@@ -118,19 +215,26 @@ def main():
         logger.error(f"Input file not found: {INPUT_FILE}")
         return
 
-    df = pd.read_csv(INPUT_FILE)
+    # wiki_brewery_cleaner writes a Parquet copy, which loads faster
+    parquet_file = fresh_parquet_copy(INPUT_FILE)
+    if parquet_file is not None:
+        df = pd.read_parquet(parquet_file)
+    else:
+        df = pd.read_csv(INPUT_FILE)
     unique_breweries = df["brewery_name"].dropna().unique()
     logger.info(f"Found {len(unique_breweries)} unique breweries to process.")
 
-    geolocator = Nominatim(user_agent="belgian_brewery_mapper_v2")
-    logger.info("Initialized Nominatim geolocator.")
+    cache = open_geocode_cache()
+    try:
+        locations = asyncio.run(geocode_breweries(unique_breweries, cache))
+    finally:
+        cache.close()
 
-    results = []
-    for brewery in tqdm(unique_breweries, desc="Geocoding Breweries"):
-        location = get_brewery_location(geolocator, brewery)
-        # The parsing now happens here, for each location object
-        structured_data = parse_location_data(brewery, location)
-        results.append(structured_data)
+    # The parsing now happens here, for each raw location
+    results = [
+        parse_location_data(brewery, location)
+        for brewery, location in zip(unique_breweries, locations)
+    ]
 
     logger.info("Finished geocoding all unique breweries.")
 
@@ -138,12 +242,17 @@ def main():
         logger.warning("No results to write. Exiting.")
         return
 
-    results_df = pd.DataFrame(results)
-
     OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    results_df.to_csv(OUTPUT_FILE, index=False)
+    # pandas quotes only the fields that need it, which keeps the CSV's format;
+    # pyarrow's CSV writer would quote the header and every string
+    pd.DataFrame(results).to_csv(OUTPUT_FILE, index=False)
+    pa_parquet.write_table(
+        pa.Table.from_pylist(results),
+        OUTPUT_FILE.with_suffix(".parquet"),
+        compression=PARQUET_COMPRESSION,
+    )
     logger.success(
-        f"Successfully saved {len(results_df)} structured brewery addresses to {OUTPUT_FILE}"
+        f"Successfully saved {len(results)} structured brewery addresses to {OUTPUT_FILE}"
     )
 
 
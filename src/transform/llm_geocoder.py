@@ -1,9 +1,20 @@
+import asyncio
+import json
+import os
 from pathlib import Path
 
 import ollama
 import pandas as pd
 from loguru import logger
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
+
+from src.util.data_files import fresh_parquet_copy
+
+# orjson parses several times faster; json.loads accepts the same str and bytes
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # --- Configuration ---
 logger.add("logs/llm_geocoder.log", rotation="10 MB", level="DEBUG")
@@ -14,8 +25,30 @@ logger.add(
 )
 
 # --- LLM and File Configuration ---
-OLLAMA_MODEL = "wizardlm2:7b"
+# Overridable so smaller models can be compared without editing the script
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "wizardlm2:7b")
+# Breweries asked about in one prompt, so the instructions are processed once
+# per batch rather than once per brewery
+LLM_BATCH_SIZE = 25
+# JSON schemas the answers are constrained to, so the model stops generating
+# as soon as the fields are filled in
+ADDRESS_FIELDS = ("municipality", "postcode", "province")
+ADDRESS_SCHEMA = {
+    "type": "object",
+    "properties": {field: {"type": "string"} for field in ADDRESS_FIELDS},
+    "required": list(ADDRESS_FIELDS),
+}
+BATCH_ADDRESS_SCHEMA = {
+    "type": "object",
+    "properties": {"addresses": {"type": "array", "items": ADDRESS_SCHEMA}},
+    "required": ["addresses"],
+}
+# Requests in flight at once, matching the number the Ollama server
+# processes in parallel
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
 INPUT_FILE = Path("data/clean/wiki_be_brewery_addresses.csv")
+# Addresses the LLM found in earlier runs, keyed by lower-cased brewery name
+ADDRESS_CACHE_FILE = Path("data/cache/llm_addresses.json")
 
 # Ensure the input file exists from the geodata_catcher step
 if not INPUT_FILE.exists():
@@ -25,13 +58,45 @@ if not INPUT_FILE.exists():
     exit()
 
 
+async def _chat(
+    client: ollama.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    prompt: str,
+    schema: dict,
+) -> dict:
+    """
+    Sends one prompt to the LLM, waiting for a free slot first.
+
+    Args:
+        client: The Ollama client.
+        semaphore: Shared limit on requests in flight.
+        prompt: The prompt to send.
+        schema: JSON schema the answer must follow.
+
+    Returns:
+        The LLM's answer, parsed from JSON.
+    """
+    async with semaphore:
+        response = await client.chat(
+            model=OLLAMA_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            format=schema,
+            options={"temperature": 0},
+        )
+    return _json_loads(response["message"]["content"])
+
+
 @logger.catch
-def get_address_with_llm(brewery_name: str) -> str | None:
+async def get_address_with_llm(
+    client: ollama.AsyncClient, semaphore: asyncio.Semaphore, brewery_name: str
+) -> str | None:
     """
     Uses a local LLM via Ollama to find the address of a Belgian brewery
     and return it in a specific, structured format.
 
     Args:
+        client: The Ollama client.
+        semaphore: Shared limit on requests in flight.
         brewery_name: The name of the brewery.
 
     Returns:
@@ -48,12 +113,9 @@ def get_address_with_llm(brewery_name: str) -> str | None:
 
     The input brewery is: "{brewery_name}".
 
-    Your output MUST be as short as possible and in the EXACT format: `municipality, postcode, province`
+    Answer in JSON with the fields "municipality", "postcode" and "province".
 
-    AVOID AT ALL COSTS:
-    - your own commentary
-    - any additional information
-    - any explanatory notes
+    AVOID AT ALL COSTS in the fields:
     - the street names
     - street number
     - country
@@ -61,41 +123,193 @@ def get_address_with_llm(brewery_name: str) -> str | None:
 
     Example of correct output:
     If you find the address for 'Brouwerij De Halve Maan' is 'Walplein 26, 8000 Brugge, West-Vlaanderen, Belgium', you must return ONLY:
-    `Brugge, 8000, West-Vlaanderen`
+    {{"municipality": "Brugge", "postcode": "8000", "province": "West-Vlaanderen"}}
 
-    If you cannot find the municipality, postcode, and province, return the exact string "Not Found".
+    If you cannot find the municipality, postcode, and province, set each field to the exact string "Not Found".
     """
 
     try:
-        response = ollama.chat(
-            model=OLLAMA_MODEL, messages=[{"role": "user", "content": prompt}]
+        answer = await _chat(client, semaphore, prompt, ADDRESS_SCHEMA)
+        return _parse_address(brewery_name, answer)
+
+    except Exception as e:
+        logger.error(
+            f"An error occurred while contacting Ollama for '{brewery_name}': {e}"
+        )
+        logger.error(
+            "Please ensure the Ollama application is running and the model is downloaded."
         )
+        return None
 
-        address = response["message"]["content"].strip()
 
-        # Check for failure cases
-        if "not found" in address.lower() or not address or len(address.split(",")) < 3:
-            logger.warning(
-                f"LLM could not find a valid structured address for '{brewery_name}'. Response: '{address}'"
-            )
-            return None
+def _parse_address(brewery_name: str, answer: dict) -> str | None:
+    """
+    Validates one LLM answer following ADDRESS_SCHEMA.
+
+    Args:
+        brewery_name: The name of the brewery the answer is for.
+        answer: The parsed answer.
 
-        # Remove any potential quotes the LLM might add around the output
-        address = address.strip('"')
+    Returns:
+        The address in "municipality, postcode, province" format, or None if
+        the LLM did not find a valid one.
+    """
+    values = [
+        str(answer.get(field) or "").strip() if isinstance(answer, dict) else ""
+        for field in ADDRESS_FIELDS
+    ]
 
-        logger.success(
-            f"LLM extracted structured address for '{brewery_name}': {address}"
+    # Check for failure cases
+    if any(not value or "not found" in value.lower() for value in values):
+        logger.warning(
+            f"LLM could not find a valid structured address for '{brewery_name}'. Response: '{answer}'"
         )
-        return address
+        return None
+
+    address = ", ".join(values)
+
+    logger.success(
+        f"LLM extracted structured address for '{brewery_name}': {address}"
+    )
+    return address
+
+
+@logger.catch
+async def get_addresses_batch(
+    client: ollama.AsyncClient, semaphore: asyncio.Semaphore, brewery_names: list[str]
+) -> list[str | None]:
+    """
+    Uses a local LLM via Ollama to find the addresses of several Belgian
+    breweries with a single prompt.
+
+    Falls back to one prompt per brewery if the answer does not have exactly
+    one address per brewery.
+
+    Args:
+        client: The Ollama client.
+        semaphore: Shared limit on requests in flight.
+        brewery_names: The names of the breweries.
+
+    Returns:
+        For each brewery, in order, the address in
+        "municipality, postcode, province" format, or None.
+    """
+    logger.info(
+        f"Attempting to find addresses for {len(brewery_names)} breweries using LLM ({OLLAMA_MODEL})..."
+    )
+
+    numbered = "\n".join(f"{i}. {name}" for i, name in enumerate(brewery_names, 1))
+
+    # --- Prompt ---
+    # Same rules as the single-brewery prompt, with one address per brewery.
+    prompt = f"""
+    You are a data extraction assistant. Your task is to find the address of each Belgian brewery below and then extract ONLY its municipality, postcode, and province.
+
+    The input breweries are:
+{numbered}
+
+    Answer in JSON with an "addresses" list of exactly {len(brewery_names)} entries, one per brewery and in the same order, each with the fields "municipality", "postcode" and "province".
+
+    AVOID AT ALL COSTS in the fields:
+    - the street names
+    - street number
+    - country
+    - brewery name
+
+    Example of a correct entry:
+    If you find the address for 'Brouwerij De Halve Maan' is 'Walplein 26, 8000 Brugge, West-Vlaanderen, Belgium', its entry must be ONLY:
+    {{"municipality": "Brugge", "postcode": "8000", "province": "West-Vlaanderen"}}
+
+    If you cannot find the municipality, postcode, and province of a brewery, set each field of its entry to the exact string "Not Found".
+    """
+
+    try:
+        answer = await _chat(client, semaphore, prompt, BATCH_ADDRESS_SCHEMA)
+        addresses = answer.get("addresses") if isinstance(answer, dict) else None
+
+        if not isinstance(addresses, list) or len(addresses) != len(brewery_names):
+            count = len(addresses) if isinstance(addresses, list) else 0
+            logger.warning(
+                f"LLM returned {count} addresses for {len(brewery_names)} breweries. Asking one at a time."
+            )
+            return await asyncio.gather(
+                *(get_address_with_llm(client, semaphore, name) for name in brewery_names)
+            )
+
+        return [
+            _parse_address(name, address)
+            for name, address in zip(brewery_names, addresses)
+        ]
 
     except Exception as e:
-        logger.error(
-            f"An error occurred while contacting Ollama for '{brewery_name}': {e}"
-        )
+        logger.error(f"An error occurred while contacting Ollama for a batch: {e}")
         logger.error(
             "Please ensure the Ollama application is running and the model is downloaded."
         )
-        return None
+        return [None] * len(brewery_names)
+
+
+async def find_addresses(brewery_names: list[str]) -> list[str | None]:
+    """
+    Finds the addresses of breweries with batched prompts sent concurrently.
+
+    Args:
+        brewery_names: The names of the breweries.
+
+    Returns:
+        For each brewery, in order, its address or None.
+    """
+    client = ollama.AsyncClient()
+    semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+    batches = [
+        brewery_names[start : start + LLM_BATCH_SIZE]
+        for start in range(0, len(brewery_names), LLM_BATCH_SIZE)
+    ]
+    # Use tqdm to show a progress bar, which is useful for long-running tasks
+    results = await tqdm_asyncio.gather(
+        *(get_addresses_batch(client, semaphore, batch) for batch in batches),
+        desc="Querying LLM",
+    )
+    # A batch that failed outright comes back as None from logger.catch
+    return [
+        address
+        for batch, batch_results in zip(batches, results)
+        for address in (batch_results or [None] * len(batch))
+    ]
+
+
+def load_address_cache(cache_file: Path = ADDRESS_CACHE_FILE) -> dict[str, str]:
+    """
+    Loads the addresses found in earlier runs.
+
+    Args:
+        cache_file: Path to the JSON cache file.
+
+    Returns:
+        Addresses keyed by lower-cased brewery name, empty if there is no cache yet.
+    """
+    try:
+        return _json_loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable address cache {cache_file}: {e}")
+        return {}
+
+
+def save_address_cache(
+    address_cache: dict[str, str], cache_file: Path = ADDRESS_CACHE_FILE
+) -> None:
+    """
+    Saves the addresses found so far for later runs.
+
+    Args:
+        address_cache: Addresses keyed by lower-cased brewery name.
+        cache_file: Path to the JSON cache file.
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(address_cache, f, ensure_ascii=False, indent=2)
 
 
 def main():
@@ -106,8 +320,14 @@ def main():
 
     # --- 1. Load Data ---
     try:
-        df = pd.read_csv(INPUT_FILE)
-        logger.info(f"Loaded {len(df)} rows from {INPUT_FILE}.")
+        # geodata_catcher writes a Parquet copy, which loads faster
+        parquet_file = fresh_parquet_copy(INPUT_FILE)
+        if parquet_file is not None:
+            df = pd.read_parquet(parquet_file)
+            logger.info(f"Loaded {len(df)} rows from {parquet_file}.")
+        else:
+            df = pd.read_csv(INPUT_FILE)
+            logger.info(f"Loaded {len(df)} rows from {INPUT_FILE}.")
     except Exception as e:
         logger.error(f"Could not read the input file: {e}")
         return
@@ -127,11 +347,29 @@ def main():
     # --- 3. Process the First 3 Breweries ---
     logger.info("Processing the first 3 breweries as a test run...")
 
-    # Use tqdm to show a progress bar, which is useful for long-running tasks
-    for brewery_name in tqdm(breweries_to_find[:3], desc="Querying LLM"):
-        # The get_address_with_llm function handles its own logging for success/failure
-        get_address_with_llm(brewery_name)
-        print("-" * 20)  # Separator for clarity
+    # Only breweries the LLM has not already answered for need a prompt
+    address_cache = load_address_cache()
+    test_breweries = list(breweries_to_find[:3])
+    for brewery_name in test_breweries:
+        if brewery_name.lower() in address_cache:
+            logger.success(
+                f"Cached structured address for '{brewery_name}': {address_cache[brewery_name.lower()]}"
+            )
+    breweries_to_query = [
+        name for name in test_breweries if name.lower() not in address_cache
+    ]
+
+    if breweries_to_query:
+        # The get_addresses_batch function handles its own logging for success/failure
+        addresses = asyncio.run(find_addresses(breweries_to_query))
+        found = {
+            name.lower(): address
+            for name, address in zip(breweries_to_query, addresses)
+            if address
+        }
+        if found:
+            address_cache.update(found)
+            save_address_cache(address_cache)
 
     logger.info("LLM geocoding test run complete.")
 
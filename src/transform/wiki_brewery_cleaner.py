@@ -15,6 +15,24 @@ logger.add(
 RAW_DATA_DIR = Path("data/raw")
 CLEAN_DATA_DIR = Path("data/clean")
 INPUT_FILE = RAW_DATA_DIR / "wiki_be_beers_breweries_provinces.csv"
+# Compression for the Parquet copies written next to each clean CSV
+PARQUET_COMPRESSION = "zstd"
+
+# Cleaning rule patterns, compiled once rather than on every name
+ALKEN_MAES_RE = re.compile(r"\bAlken[- ]Maes\b", re.IGNORECASE)
+AB_INBEV_RE = re.compile(r"\b(ab-?inbev|inbev)\b", re.IGNORECASE)
+SEPARATOR_RE = re.compile(
+    r"\s*\(?vroeger|\s*inopdracht van|\s+in\s+De Proefbrouwerij|\s+voor|\s+brewed for|\s+gebrouwen|\s+in opdracht van|\s+bij|\s+nu|\s+later|\s+door",
+    re.IGNORECASE,
+)
+PAREN_RE = re.compile(r"\s*\([^)]*\)?")
+DUP_WORD_RE = re.compile(r"\b(\w+)\s+\1\b", re.IGNORECASE)
+# Lowercase substrings, one of which any name matching the Alken-Maes,
+# AB InBev or separator patterns above must contain
+RULE_KEYWORDS = (
+    "alken", "inbev", "vroeger", "opdracht", "proefbrouwerij", "voor",
+    "brewed for", "gebrouwen", "bij", "nu", "later", "door",
+)
 
 
 def clean_brewery_name(name: str) -> str:
@@ -31,14 +49,21 @@ def clean_brewery_name(name: str) -> str:
     # Rule 1: Remove leading/trailing quotes and whitespace
     cleaned_name = cleaned_name.strip().strip('"')
 
+    # Most names contain none of the keywords, so their keyword rules can be
+    # skipped. Non-ASCII names always take the full path, since the patterns'
+    # case-insensitive matching is wider than str.lower() there
+    lowered = cleaned_name.lower()
+    has_keywords = not cleaned_name.isascii() or any(
+        keyword in lowered for keyword in RULE_KEYWORDS
+    )
+
     # --- RULE for Alken-Maes ---
     # Rule 2: Handle specific, high-priority standardizations
     # This now catches "Alken Maes" and "Alken-Maes"
-    if re.search(r"\bAlken[- ]Maes\b", cleaned_name, re.IGNORECASE):
-        return "Alken-Maes"
-    cleaned_name = re.sub(
-        r"\b(ab-?inbev|inbev)\b", "AB InBev", cleaned_name, flags=re.IGNORECASE
-    )
+    if has_keywords:
+        if ALKEN_MAES_RE.search(cleaned_name):
+            return "Alken-Maes"
+        cleaned_name = AB_INBEV_RE.sub("AB InBev", cleaned_name)
 
     # Rule 3: Handle comma-separated lists and collaborations
     if "collaboration brew" in cleaned_name.lower():
@@ -49,20 +74,17 @@ def clean_brewery_name(name: str) -> str:
         cleaned_name = cleaned_name.split(",")[0]
 
     # Rule 4: Handle separator phrases to remove annotations
-    separator_pattern = re.compile(
-        r"\s*\(?vroeger|\s*inopdracht van|\s+in\s+De Proefbrouwerij|\s+voor|\s+brewed for|\s+gebrouwen|\s+in opdracht van|\s+bij|\s+nu|\s+later|\s+door",
-        re.IGNORECASE,
-    )
-    match = separator_pattern.search(cleaned_name)
+    match = SEPARATOR_RE.search(cleaned_name) if has_keywords else None
     if match:
         cleaned_name = cleaned_name[: match.start()]
 
     # --- Post-processing and refinement ---
     # Rule 5: Remove any remaining text in parentheses
-    cleaned_name = re.sub(r"\s*\([^)]*\)?", "", cleaned_name)
+    if "(" in cleaned_name:
+        cleaned_name = PAREN_RE.sub("", cleaned_name)
 
     # Rule 6: Remove consecutive duplicate words
-    cleaned_name = re.sub(r"\b(\w+)\s+\1\b", r"\1", cleaned_name, flags=re.IGNORECASE)
+    cleaned_name = DUP_WORD_RE.sub(r"\1", cleaned_name)
 
     # Rule 7: Clean up leading and trailing characters
     cleaned_name = cleaned_name.strip().rstrip(")-.,")
@@ -97,7 +119,11 @@ def main():
 
     # --- 2. Clean Brewery Names (Content) ---
     logger.info("Applying content cleaning rules to 'brewery_name' column...")
-    df["brewery_name"] = df["brewery_name"].apply(clean_brewery_name)
+    # Each brewery appears once per beer, so clean every distinct name once
+    # and map the results back onto the column
+    unique_names = df["brewery_name"].dropna().unique()
+    cleaned_names = dict(zip(unique_names, map(clean_brewery_name, unique_names)))
+    df["brewery_name"] = df["brewery_name"].map(cleaned_names)
     logger.success("Content cleaning complete.")
 
     # --- NEW STEP: Enforce data integrity for specific breweries ---
@@ -121,6 +147,11 @@ def main():
         beer_df = df[beer_columns]
         beer_output_file = CLEAN_DATA_DIR / "wiki_be_beers.csv"
         beer_df.to_csv(beer_output_file, index=False)
+        beer_df.to_parquet(
+            beer_output_file.with_suffix(".parquet"),
+            index=False,
+            compression=PARQUET_COMPRESSION,
+        )
         logger.success(
             f"Successfully saved beer data ({len(beer_df)} rows) to {beer_output_file}"
         )
@@ -143,6 +174,11 @@ def main():
 
         brewery_output_file = CLEAN_DATA_DIR / "wiki_be_breweries.csv"
         unique_breweries_df.to_csv(brewery_output_file, index=False)
+        unique_breweries_df.to_parquet(
+            brewery_output_file.with_suffix(".parquet"),
+            index=False,
+            compression=PARQUET_COMPRESSION,
+        )
         logger.success(
             f"Successfully saved unique brewery data ({len(unique_breweries_df)} rows) to {brewery_output_file}"
         )
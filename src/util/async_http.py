@@ -0,0 +1,84 @@
+import asyncio
+from typing import TYPE_CHECKING, Collection, Optional
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class RequestPacer:
+    """
+    Spaces request starts at least `interval` seconds apart across coroutines.
+
+    Requests still overlap in flight, so a slow response does not hold back
+    the next one, but the server never sees new requests faster than the
+    interval allows.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Waits until the next request may start."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = loop.time() + self.interval
+
+
+async def read_with_retry(
+    session: "aiohttp.ClientSession",
+    url: str,
+    retries: int,
+    backoff: float,
+    statuses: Collection[int],
+    pacer: Optional[RequestPacer] = None,
+) -> bytes:
+    """
+    Downloads a page with aiohttp, retrying transient failures with backoff.
+
+    Mirrors the urllib3 Retry policies mounted on the scrapers' requests
+    sessions: `retries` extra attempts, sleeping backoff * 2**attempt seconds
+    before each one. Every attempt waits for its turn with the pacer, if any.
+
+    Args:
+        session: The aiohttp session to fetch with.
+        url: The URL to fetch.
+        retries: Number of retries after the first attempt.
+        backoff: Backoff factor in seconds.
+        statuses: HTTP statuses that are retried.
+        pacer: Shared pacer spacing out request starts.
+
+    Returns:
+        The response body.
+
+    Raises:
+        aiohttp.ClientError: If the request still fails after all retries.
+        asyncio.TimeoutError: If the last attempt times out.
+    """
+    import aiohttp
+
+    for attempt in range(retries):
+        if pacer is not None:
+            await pacer.wait()
+        try:
+            async with session.get(url) as response:
+                if response.status not in statuses:
+                    response.raise_for_status()
+                    return await response.read()
+                logger.warning(f"Retrying {url} after HTTP {response.status}")
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            logger.warning(f"Retrying {url} after error: {e}")
+        await asyncio.sleep(backoff * 2**attempt)
+
+    # Final attempt; any failure now propagates to the caller
+    if pacer is not None:
+        await pacer.wait()
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
@@ -0,0 +1,24 @@
+from pathlib import Path
+from typing import Optional
+
+
+def fresh_parquet_copy(csv_file: Path) -> Optional[Path]:
+    """
+    Finds the Parquet copy written next to a CSV file, if it is still current.
+
+    A copy older than its CSV is ignored, so a CSV that was regenerated or
+    edited by hand afterwards is always the one read.
+
+    Args:
+        csv_file: Path to the CSV file.
+
+    Returns:
+        The path to the Parquet copy, or None if there is no current one.
+    """
+    parquet_file = csv_file.with_suffix(".parquet")
+    try:
+        if parquet_file.stat().st_mtime_ns >= csv_file.stat().st_mtime_ns:
+            return parquet_file
+    except FileNotFoundError:
+        pass
+    return None